@@ -4,6 +4,7 @@ from typing import Optional
 from config import bot_state, config
 from indices import get_index_config, get_available_indices
 from database import save_config, load_config
+from option_price_engine import option_price_engine
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -98,7 +99,7 @@ def get_position() -> dict:
     index_config = get_index_config(config['selected_index'])
     qty = int(bot_state['current_position'].get('qty') or 0)
     if qty <= 0:
-        qty = config['order_qty'] * index_config['lot_size']
+        qty = config['order_qty'] * index_config.lot_size
     unrealized_pnl = (bot_state['current_option_ltp'] - bot_state['entry_price']) * qty
     
     return {
@@ -136,9 +137,9 @@ def get_config() -> dict:
         # Index & Timeframe
         "selected_index": config['selected_index'],
         "candle_interval": config['candle_interval'],
-        "lot_size": index_config['lot_size'],
-        "strike_interval": index_config['strike_interval'],
-        "expiry_type": index_config.get('expiry_type', 'weekly'),
+        "lot_size": index_config.lot_size,
+        "strike_interval": index_config.strike_interval,
+        "expiry_type": index_config.expiry_type,
         # Risk Parameters
         "order_qty": config['order_qty'],
         "max_trades_per_day": config['max_trades_per_day'],
@@ -385,6 +386,7 @@ async def update_config_values(updates: dict) -> dict:
         if new_index in available:
             config['selected_index'] = new_index
             bot_state['selected_index'] = new_index
+            option_price_engine.set_selected_index(new_index)
             updated_fields.append('selected_index')
             logger.info(f"[CONFIG] Index changed to: {new_index}")
 
@@ -596,11 +598,11 @@ def get_available_indices_list() -> list:
     for name, cfg in INDICES.items():
         result.append({
             "name": name,
-            "display_name": cfg['name'],
-            "lot_size": cfg['lot_size'],
-            "strike_interval": cfg['strike_interval'],
-            "expiry_type": cfg.get('expiry_type', 'weekly'),
-            "expiry_day": cfg.get('expiry_day', 1)
+            "display_name": cfg.name,
+            "lot_size": cfg.lot_size,
+            "strike_interval": cfg.strike_interval,
+            "expiry_type": cfg.expiry_type,
+            "expiry_day": cfg.expiry_day
         })
     return result
 
@@ -16,7 +16,6 @@ What it does NOT do:
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -43,12 +42,9 @@ async def reconcile_with_broker(bot) -> bool:
     logger.info("[RECONCILE] Checking Dhan for open positions...")
 
     try:
-        positions = await asyncio.to_thread(bot.dhan.dhan.get_positions)
-        raw = []
-        if isinstance(positions, dict):
-            raw = positions.get('data', []) or []
-        elif isinstance(positions, list):
-            raw = positions
+        raw = await bot.dhan.get_positions()
+        if not isinstance(raw, list):
+            raw = []
     except Exception as e:
         logger.warning(f"[RECONCILE] Failed to fetch positions from Dhan: {e}")
         return False
@@ -111,9 +107,7 @@ async def reconcile_with_broker(bot) -> bool:
     # Fetch live LTP for the option
     live_ltp = avg_price  # fallback to avg cost
     try:
-        live_ltp = await asyncio.to_thread(
-            bot.dhan.get_index_and_option_ltp, index_name, int(security_id)
-        )
+        live_ltp = await bot.dhan.get_index_and_option_ltp_async(index_name, int(security_id))
         if isinstance(live_ltp, tuple):
             live_ltp = live_ltp[1] or avg_price
         live_ltp = float(live_ltp) if live_ltp and float(live_ltp) > 0 else avg_price
@@ -143,6 +137,9 @@ async def reconcile_with_broker(bot) -> bool:
     bot_state['current_option_ltp'] = live_ltp
     bot_state['trailing_sl']        = None
 
+    from option_price_engine import option_price_engine
+    option_price_engine.notify_position_change()
+
     logger.info(
         f"[RECONCILE] ✓ State rebuilt | {index_name} {option_type} {strike} | "
         f"Qty={qty} | AvgCost=₹{avg_price:.2f} | LiveLTP=₹{live_ltp:.2f} | "
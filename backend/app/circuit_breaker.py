@@ -0,0 +1,89 @@
+"""CircuitBreaker — fail fast on broker calls while the broker is erroring.
+
+States:
+    CLOSED    — calls pass through; consecutive failures are counted
+    OPEN      — calls are rejected immediately with CircuitOpenError
+    HALF_OPEN — reset timeout elapsed; one trial call is let through, others
+                are rejected until it reports (or reset_timeout passes without
+                a result, e.g. the trial was cancelled)
+
+Transitions:
+    CLOSED    → OPEN      (failure_threshold consecutive failures)
+    OPEN      → HALF_OPEN (reset_timeout seconds elapsed)
+    HALF_OPEN → CLOSED    (trial call succeeded)
+    HALF_OPEN → OPEN      (trial call failed)
+"""
+from __future__ import annotations
+
+import logging
+import time
+from enum import Enum, auto
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(Enum):
+    CLOSED    = auto()
+    OPEN      = auto()
+    HALF_OPEN = auto()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is attempted while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (single event loop; not thread-safe)."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls are currently blocked."""
+        if self.state is BreakerState.CLOSED:
+            return
+        now = time.monotonic()
+        if self.state is BreakerState.OPEN:
+            if now - (self.opened_at or 0.0) < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit open")
+            self.state = BreakerState.HALF_OPEN
+            logger.info(f"[BREAKER] {self.name}: HALF_OPEN (trial call)")
+        elif now - (self.probe_started_at or 0.0) < self.reset_timeout:
+            # HALF_OPEN with the trial call still outstanding
+            raise CircuitOpenError(f"{self.name} circuit half-open (trial call in progress)")
+        self.probe_started_at = now
+
+    def on_success(self) -> None:
+        if self.state is not BreakerState.CLOSED:
+            logger.info(f"[BREAKER] {self.name}: CLOSED (broker recovered)")
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def on_ignored(self) -> None:
+        """Call completed with a result that says nothing about broker health.
+
+        Leaves the state and failure count alone; in HALF_OPEN it frees the
+        trial slot so the next call can probe.
+        """
+        if self.state is BreakerState.HALF_OPEN:
+            self.probe_started_at = None
+
+    def on_failure(self) -> None:
+        self.failure_count += 1
+        if self.state is BreakerState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state is not BreakerState.OPEN:
+                logger.warning(
+                    f"[BREAKER] {self.name}: OPEN after {self.failure_count} consecutive failures "
+                    f"(retry in {self.reset_timeout:.0f}s)"
+                )
+            self.state = BreakerState.OPEN
+            self.opened_at = time.monotonic()
@@ -3,13 +3,214 @@ try:
     from dhanhq import dhanhq  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover
     dhanhq = None
+import asyncio
+import httpx
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx (pip install httpx[http2])
+    HTTP2_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from typing import Any, Optional
 import logging
+import random
+import re
+import time
+from circuit_breaker import CircuitBreaker, CircuitOpenError
 from config import bot_state
-from indices import get_index_config
+from indices import IndexConfig, get_index_config
 
 logger = logging.getLogger(__name__)
 DEFAULT_FNO_SEGMENT = "NSE_FNO"
+DHAN_API_BASE = "https://api.dhan.co/v2"
+
+# Alternative key names seen across Dhan SDK/API versions (checked in order)
+_STRIKE_KEYS = ('strike_price', 'strikePrice', 'strike')
+_CE_KEYS = ('ce', 'CE', 'call', 'CALL')
+_PE_KEYS = ('pe', 'PE', 'put', 'PUT')
+_SECID_KEYS = ('security_id', 'securityId')
+_ORDERID_KEYS = ('orderId', 'order_id', 'id')
+_ORDER_STATUS_KEYS = ('orderStatus', 'status')
+_FILLED_QTY_KEYS = ('filledQty', 'filled_qty', 'tradedQuantity')
+_AVG_PRICE_KEYS = ('averagePrice', 'average_price', 'tradedPrice')
+_REJECTION_KEYS = ('rejectionReason', 'reason', 'rejection_reason')
+
+# Dhan v2 order status sets
+FILLED_STATUSES   = frozenset({'TRADED', 'COMPLETE', 'COMPLETED', 'FILLED'})
+PARTIAL_STATUSES  = frozenset({'PART_TRADED', 'PARTIALLY_TRADED', 'PARTIAL'})
+OPEN_STATUSES     = frozenset({'TRANSIT', 'PENDING', 'OPEN', 'AFTER_MARKET_ORDER_REQ_RECEIVED', 'AMO_REQ_RECEIVED'})
+REJECTED_STATUSES = frozenset({'REJECTED'})
+CANCEL_STATUSES   = frozenset({'CANCELLED', 'EXPIRED', 'CANCELPENDING'})
+
+# verify_order_filled polling: exponential backoff (with jitter) between polls,
+# and the full order list is only scanned every Nth attempt.
+_POLL_BASE_DELAY = 0.25
+_POLL_MAX_DELAY = 2.0
+_ORDER_LIST_EVERY = 5
+# Max wait for the shared order-list scan to report on an order
+_ORDER_LIST_WAIT = 2.0
+# Markers of broker-side throttling / unavailability (Dhan DH-904 = rate limit)
+_THROTTLE_MARKERS = ('429', '503', 'DH-904', 'too many requests', 'rate limit')
+# Client-side errors that say nothing about broker health, e.g. an order that
+# is not visible yet (HTTP 4xx other than 429; DH-905/906/907 input/order/data)
+_HTTP_4XX_RE = re.compile(r'\bHTTP 4(?!29)\d\d\b')
+_HTTP_5XX_RE = re.compile(r'\bHTTP 5\d\d\b')
+_CLIENT_ERROR_MARKERS = ('DH-905', 'DH-906', 'DH-907', 'not found')
+
+
+@dataclass(slots=True)
+class OrderResult:
+    """Result of an order placement or fill verification.
+
+    `price`/`quantity` carry the placement qty (place_order) or the average
+    fill price and filled qty (verify_order_filled).
+    """
+    status: str
+    order_id: Optional[str] = None
+    price: float = 0.0
+    quantity: int = 0
+    filled: bool = False
+    message: str = ""
+    raw: Any = None
+
+    def to_dict(self) -> dict:
+        """Legacy dict shape (union of the old place/verify response keys)."""
+        return {
+            "status": self.status,
+            "orderId": self.order_id,
+            "order_id": self.order_id,
+            "price": self.price,
+            "average_price": self.price,
+            "quantity": self.quantity,
+            "filled_qty": self.quantity,
+            "filled": self.filled,
+            "message": self.message,
+            "data": self.raw,
+        }
+
+
+def _is_throttled(resp_or_exc: object) -> bool:
+    """True if a Dhan response/exception looks like HTTP 429/503 or a rate-limit error."""
+    if isinstance(resp_or_exc, dict):
+        if resp_or_exc.get('status') == 'success':
+            return False
+        text = str(resp_or_exc.get('remarks') or resp_or_exc.get('data') or '')
+    else:
+        text = str(resp_or_exc)
+    text = text.lower()
+    return any(m.lower() in text for m in _THROTTLE_MARKERS)
+
+
+def _is_client_error(resp: object) -> bool:
+    """True if a failed Dhan response is a 4xx-style client error (not a broker outage)."""
+    if not isinstance(resp, dict) or resp.get('status') == 'success':
+        return False
+    text = str(resp.get('remarks') or resp.get('data') or '')
+    if _HTTP_5XX_RE.search(text):
+        return False
+    if _HTTP_4XX_RE.search(text):
+        return True
+    text = text.lower()
+    return any(m.lower() in text for m in _CLIENT_ERROR_MARKERS)
+
+
+def _poll_delay(attempt: int, throttled: bool = False) -> float:
+    """Backoff delay for poll attempt N: capped exponential growth, ±20% jitter."""
+    delay = min(_POLL_MAX_DELAY, _POLL_BASE_DELAY * (1.5 ** attempt)) * random.uniform(0.8, 1.2)
+    # Broker is pushing back: back off harder immediately
+    return delay * 2 if throttled else delay
+
+
+def _first_of(d: dict, keys: tuple):
+    """Return the first non-None value of d for the given alternative keys."""
+    for k in keys:
+        v = d.get(k)
+        if v is not None:
+            return v
+    return None
+
+
+def _first_truthy(d: dict, keys: tuple, default=None):
+    """Return the first truthy value of d for the given alternative keys."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+def _safe_num(d: dict, keys: tuple, cast, default):
+    """First truthy value for keys passed through cast (default if missing or unparseable)."""
+    v = _first_truthy(d, keys)
+    if v is None:
+        return default
+    try:
+        return cast(v)
+    except (TypeError, ValueError):
+        return default
+
+
+class OrderPoller:
+    """Shares one get_order_list scan per tick across concurrent order pollers.
+
+    Callers `fetch(order_id)` and await the next scan; a single background task
+    fetches the order list every `interval` seconds while anyone is waiting and
+    fans the matching order dict (or None if absent) out to each waiter. The
+    task exits once there are no waiters.
+    """
+
+    def __init__(self, api: "DhanAPI", interval: float = 0.5):
+        self._api = api
+        self.interval = interval
+        self._pending = {}  # order_id -> [Future]
+        self._task = None
+
+    async def fetch(self, order_id: str, timeout: float = _ORDER_LIST_WAIT):
+        """Return this order's entry from the next scan (None if absent or timed out)."""
+        key = str(order_id)
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(fut)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._pending.get(key)
+            if waiters and fut in waiters:
+                waiters.remove(fut)
+                if not waiters:
+                    self._pending.pop(key, None)
+
+    async def _run(self):
+        while self._pending:
+            error = None
+            orders_by_id = {}
+            try:
+                resp = await self._api._get_order_list_cached()
+                if resp and 'data' in resp:
+                    raw = self._api._unwrap(resp)
+                    if isinstance(raw, list):
+                        # Index once per scan; every waiter then does an O(1) lookup
+                        orders_by_id = {str(o.get('orderId')): o for o in raw if isinstance(o, dict)}
+            except Exception as e:  # includes CircuitOpenError; surfaced to every waiter
+                error = e
+
+            pending, self._pending = self._pending, {}
+            for order_id, waiters in pending.items():
+                order = orders_by_id.get(order_id)
+                for fut in waiters:
+                    if fut.done():
+                        continue
+                    if error is not None:
+                        fut.set_exception(error)
+                    else:
+                        fut.set_result(order)
+
+            await asyncio.sleep(self.interval)
+
 
 class DhanAPI:
     def __init__(self, access_token: str, client_id: str):
@@ -27,11 +228,41 @@ class DhanAPI:
                 f"[ORDER] Dhan API missing segment attribute: {DEFAULT_FNO_SEGMENT}. "
                 "Verify the Dhan SDK version and initialization; order placement will fail."
             )
+        # Resolved SDK exchange segment per index (filled lazily by place_order)
+        self._segment_by_index = {}
         # Cache for option chain to avoid rate limiting
         self._option_chain_cache = {}
         self._option_chain_cache_time = {}
         self._cache_duration = 60  # Default cache for 60 seconds
+        # Per-chain {(strike, 'CE'|'PE'): security_id} for strikes around spot,
+        # rebuilt whenever the chain cache is refreshed.
+        self._secid_by_strike = {}
+        self._atm_precompute_strikes = 5  # spot ± N strike intervals
         self._position_cache_duration = 10  # Shorter cache when position is open
+        # Fail fast on order-status polling while Dhan is erroring/throttling
+        self._order_breaker = CircuitBreaker("dhan-orders", failure_threshold=5, reset_timeout=30.0)
+        # One shared order-list scan for concurrent verify_order_filled calls
+        self._order_poller = OrderPoller(self)
+        self._inflight_verifications = 0
+        # Broker positions memoized for one poll cycle: (monotonic_ts, positions)
+        self._positions_cache = None
+        self._positions_cache_ttl = 0.5
+        # Order list memoized briefly so near-simultaneous scans share one request
+        self._ol_cache: Optional[tuple[float, Any]] = None
+        self._ol_cache_ttl = 0.25
+        self._ol_lock = asyncio.Lock()
+        # Keep-alive HTTP client for order-status polling (created lazily on first use)
+        self._http: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _unwrap(resp: object) -> object:
+        """Return the payload of a Dhan response, unwrapping {'data': {'data': ...}} nesting."""
+        data = resp.get('data', {}) if isinstance(resp, dict) else {}
+        if isinstance(data, dict):
+            inner = data.get('data')
+            if isinstance(inner, (dict, list)):
+                return inner
+        return data
 
     def _extract_option_chain_oc(self, chain: dict) -> object:
         """Extract option-chain 'oc' payload from Dhan response.
@@ -43,9 +274,7 @@ class DhanAPI:
         if not chain or chain.get('status') != 'success':
             return {}
 
-        data = chain.get('data', {})
-        if isinstance(data, dict) and 'data' in data and isinstance(data.get('data'), dict):
-            data = data.get('data', {})
+        data = self._unwrap(chain)
 
         if isinstance(data, dict):
             return data.get('oc', {})
@@ -102,11 +331,7 @@ class DhanAPI:
             for entry in oc_data:
                 if not isinstance(entry, dict):
                     continue
-                sp = entry.get('strike_price')
-                if sp is None:
-                    sp = entry.get('strikePrice')
-                if sp is None:
-                    sp = entry.get('strike')
+                sp = _first_of(entry, _STRIKE_KEYS)
                 try:
                     if sp is not None and abs(float(sp) - float(strike)) < 0.001:
                         return str(sp), entry
@@ -148,11 +373,7 @@ class DhanAPI:
             for entry in oc_data:
                 if not isinstance(entry, dict):
                     continue
-                sp = entry.get('strike_price')
-                if sp is None:
-                    sp = entry.get('strikePrice')
-                if sp is None:
-                    sp = entry.get('strike')
+                sp = _first_of(entry, _STRIKE_KEYS)
                 try:
                     numeric_sp = float(sp)
                 except Exception:
@@ -171,9 +392,7 @@ class DhanAPI:
         """Extract security id from option payload across possible key names."""
         if not isinstance(opt_data, dict):
             return ""
-        security_id = opt_data.get('security_id')
-        if security_id is None:
-            security_id = opt_data.get('securityId')
+        security_id = _first_of(opt_data, _SECID_KEYS)
         if security_id is None and isinstance(opt_data.get('instrument'), dict):
             security_id = opt_data['instrument'].get('security_id')
         return str(security_id) if security_id else ""
@@ -182,8 +401,8 @@ class DhanAPI:
         """Get index spot LTP"""
         try:
             index_config = get_index_config(index_name)
-            security_id = index_config["security_id"]
-            segment = index_config["exchange_segment"]
+            security_id = index_config.security_id
+            segment = index_config.exchange_segment
             
             # For SENSEX, try multiple segments as Dhan API may vary
             segments_to_try = [segment]
@@ -196,10 +415,7 @@ class DhanAPI:
                 })
                 
                 if response and response.get('status') == 'success':
-                    data = response.get('data', {})
-                    if isinstance(data, dict) and 'data' in data:
-                        data = data.get('data', {})
-                    
+                    data = self._unwrap(response)
                     idx_data = data.get(seg, {}).get(str(security_id), {})
                     if idx_data:
                         ltp = idx_data.get('last_price')
@@ -217,55 +433,79 @@ class DhanAPI:
     
     def get_index_and_option_ltp(self, index_name: str, option_security_id: int) -> tuple:
         """Get both Index and Option LTP in a single API call"""
-        index_ltp = 0
-        option_ltp = 0
-        
         try:
-            index_config = get_index_config(index_name)
-            security_id = index_config["security_id"]
-            segment = index_config["exchange_segment"]
-            fno_segment = index_config.get("fno_segment", "NSE_FNO")
-            
+            segment, security_id, fno_segment = self._combined_quote_keys(index_name)
             # Fetch both in single call to avoid rate limits
             response = self.dhan.quote_data({
                 segment: [security_id],
                 fno_segment: [option_security_id]
             })
-            
-            if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, dict) and 'data' in data:
-                    data = data.get('data', {})
-                
-                # Get Index LTP
-                idx_data = data.get(segment, {}).get(str(security_id), {})
-                if idx_data:
-                    try:
-                        index_ltp = float(idx_data.get('last_price', 0))
-                    except Exception:
-                        index_ltp = 0
-                
-                # Get Option LTP
-                fno_data = data.get(fno_segment, {}).get(str(option_security_id), {})
-                if fno_data:
-                    try:
-                        option_ltp = float(fno_data.get('last_price', 0))
-                    except Exception:
-                        option_ltp = 0
+            return self._parse_combined_quote(response, index_name, option_security_id)
+        except Exception as e:
+            logger.error(f"Error fetching combined quote: {e}")
+            return 0, 0
 
-                logger.info(f"[OPT] Quote: {index_name}={index_ltp}, Option {option_security_id}={option_ltp} (segments: index={segment}, option={fno_segment})")
-                    
+    async def get_index_and_option_ltp_async(self, index_name: str, option_security_id: int) -> tuple:
+        """Async get_index_and_option_ltp: POSTs /marketfeed/quote on the shared HTTP client (no thread hop)"""
+        try:
+            segment, security_id, fno_segment = self._combined_quote_keys(index_name)
+            r = await self._http_client().post(
+                "/marketfeed/quote",
+                json={segment: [security_id], fno_segment: [int(option_security_id)]},
+            )
+            if r.status_code != 200:
+                logger.error(f"Error fetching combined quote: HTTP {r.status_code}: {r.text[:200]}")
+                return 0, 0
+            # Same {'status', 'data'} envelope the SDK returns
+            response = {'status': 'success', 'remarks': '', 'data': r.json()}
+            return self._parse_combined_quote(response, index_name, option_security_id)
         except Exception as e:
             logger.error(f"Error fetching combined quote: {e}")
-        
+            return 0, 0
+
+    @staticmethod
+    def _combined_quote_keys(index_name: str) -> tuple:
+        """(index segment, index security_id, F&O segment) for a combined index+option quote."""
+        index_config = get_index_config(index_name)
+        return index_config.exchange_segment, index_config.security_id, index_config.fno_segment
+
+    def _parse_combined_quote(self, response: object, index_name: str, option_security_id: int) -> tuple:
+        """Extract (index_ltp, option_ltp) from a combined quote response (0 where missing)."""
+        index_ltp = 0
+        option_ltp = 0
+        segment, security_id, fno_segment = self._combined_quote_keys(index_name)
+
+        if response and response.get('status') == 'success':
+            data = self._unwrap(response)
+
+            # Get Index LTP
+            idx_data = data.get(segment, {}).get(str(security_id), {})
+            if idx_data:
+                try:
+                    index_ltp = float(idx_data.get('last_price', 0))
+                except Exception:
+                    index_ltp = 0
+            
+            # Get Option LTP
+            fno_data = data.get(fno_segment, {}).get(str(option_security_id), {})
+            if fno_data:
+                try:
+                    option_ltp = float(fno_data.get('last_price', 0))
+                except Exception:
+                    option_ltp = 0
+
+            logger.info(
+                "[OPT] Quote: %s=%s, Option %s=%s (segments: index=%s, option=%s)",
+                index_name, index_ltp, option_security_id, option_ltp, segment, fno_segment,
+            )
+
         return index_ltp, option_ltp
     
     async def get_option_chain(self, index_name: str = "NIFTY", expiry: str = None, force_refresh: bool = False) -> dict:
         """Get option chain with caching"""
         try:
-            import asyncio
             index_config = get_index_config(index_name)
-            security_id = index_config["security_id"]
+            security_id = index_config.security_id
             
             if not expiry:
                 expiry = await self.get_nearest_expiry(index_name)
@@ -302,11 +542,12 @@ class DhanAPI:
                 logger.info(f"Option chain cached at {now.strftime('%H:%M:%S')}")
                 # DEBUG: log structure to diagnose strike matching failures
                 oc = self._extract_option_chain_oc(response)
+                self._secid_by_strike[cache_key] = self._precompute_atm_security_ids(response, oc, index_config)
                 if isinstance(oc, dict):
                     sample_keys = list(oc.keys())[:5]
                     logger.info(f"[DEBUG] Option chain oc keys (first 5): {sample_keys}")
                 elif isinstance(oc, list):
-                    sample = [(e.get('strike_price') or e.get('strikePrice') or e.get('strike')) for e in oc[:5]]
+                    sample = [_first_of(e, _STRIKE_KEYS) for e in oc[:5]]
                     logger.info(f"[DEBUG] Option chain oc list strikes (first 5): {sample}")
                 else:
                     logger.info(f"[DEBUG] Option chain oc type: {type(oc)} | raw data keys: {list(response.get('data', {}).keys()) if isinstance(response.get('data'), dict) else 'not a dict'}")
@@ -316,12 +557,48 @@ class DhanAPI:
             logger.error(f"Error fetching option chain: {e}")
         return {}
     
+    def _precompute_atm_security_ids(self, chain: dict, oc_data: object, index_config: IndexConfig) -> dict:
+        """Extract CE/PE security IDs for spot ± N strikes from a freshly fetched chain."""
+        secids = {}
+        if not oc_data:
+            return secids
+        try:
+            interval = int(index_config.strike_interval or 0)
+            if interval <= 0:
+                return secids
+
+            # Prefer the underlying LTP reported with the chain, else the last known index LTP
+            payload = self._unwrap(chain)
+            spot = payload.get('last_price') if isinstance(payload, dict) else None
+            if not spot:
+                spot = bot_state.get('index_ltp')
+            spot = float(spot or 0)
+            if spot <= 0:
+                return secids
+
+            atm = int(round(spot / interval)) * interval
+            span = self._atm_precompute_strikes * interval
+            for strike in range(atm - span, atm + span + 1, interval):
+                _, strike_node = self._match_strike_node(oc_data, strike)
+                if not isinstance(strike_node, dict) or not strike_node:
+                    continue
+                for option_type, keys in (('CE', _CE_KEYS), ('PE', _PE_KEYS)):
+                    for k in keys:
+                        node = strike_node.get(k)
+                        if isinstance(node, dict) and node:
+                            security_id = self._extract_security_id(node)
+                            if security_id:
+                                secids[(strike, option_type)] = security_id
+                            break
+        except Exception as e:
+            logger.debug(f"[DHAN] ATM security ID precompute skipped: {e}")
+        return secids
+
     async def get_nearest_expiry(self, index_name: str = "NIFTY") -> str:
         """Get nearest expiry date"""
         try:
-            import asyncio
             index_config = get_index_config(index_name)
-            security_id = index_config["security_id"]
+            security_id = index_config.security_id
             
             for segment in ['IDX_I', 'NSE_FNO', 'INDEX']:
                 logger.info(f"Trying expiry_list for {index_name} with segment: {segment}")
@@ -333,13 +610,7 @@ class DhanAPI:
                 logger.info(f"Expiry list response: {response}")
                 
                 if response and response.get('status') == 'success':
-                    data = response.get('data', {})
-                    if isinstance(data, dict) and 'data' in data:
-                        expiries = data.get('data', [])
-                    elif isinstance(data, list):
-                        expiries = data
-                    else:
-                        expiries = []
+                    expiries = self._unwrap(response)
                     
                     if expiries and isinstance(expiries, list):
                         today = datetime.now().date()
@@ -372,7 +643,7 @@ class DhanAPI:
         
         # Fallback: calculate based on index expiry day
         index_config = get_index_config(index_name)
-        expiry_day = index_config["expiry_day"]
+        expiry_day = index_config.expiry_day
         
         ist = datetime.now(timezone.utc) + timedelta(hours=5, minutes=30)
         days_until_expiry = (expiry_day - ist.weekday()) % 7
@@ -391,14 +662,13 @@ class DhanAPI:
                 expiry = await self.get_nearest_expiry(index_name)
 
             index_config = get_index_config(index_name)
-            strike_interval = float(index_config.get('strike_interval', 0) or 0)
+            strike_interval = float(index_config.strike_interval or 0)
             # Fallback tolerance for nearest strike matching (helps SENSEX/BSE chains).
             # Allow up to 1 interval difference; if interval is unknown, allow 100.
             nearest_max_diff = strike_interval if strike_interval > 0 else 100.0
 
             # Dhan option-chain can intermittently return partial/empty oc payload.
             # Retry once with force_refresh to avoid cache + transient API hiccups.
-            import asyncio
             for attempt in range(2):
                 chain = await self.get_option_chain(index_name=index_name, expiry=expiry, force_refresh=(attempt == 1))
 
@@ -416,20 +686,25 @@ class DhanAPI:
                         continue
                     break
 
+                # Fast path: IDs pre-extracted around spot when the chain was fetched
+                security_id = self._secid_by_strike.get(f"{index_name}_{expiry}", {}).get(
+                    (int(strike), option_type.upper())
+                )
+                if security_id:
+                    return security_id
+
                 matched_key, strike_node = self._match_strike_node(oc_data, strike)
                 if not strike_node:
                     matched_key, strike_node = self._match_nearest_strike_node(oc_data, strike, max_diff=nearest_max_diff)
                 if isinstance(strike_node, dict) and strike_node:
                     # Dhan payload keys can vary in case; try a small set of common keys.
-                    if option_type.upper() == 'CE':
-                        opt_candidates = ['ce', 'CE', 'call', 'CALL']
-                    else:
-                        opt_candidates = ['pe', 'PE', 'put', 'PUT']
+                    opt_candidates = _CE_KEYS if option_type.upper() == 'CE' else _PE_KEYS
 
                     opt_data = {}
                     for k in opt_candidates:
-                        if isinstance(strike_node.get(k), dict) and strike_node.get(k):
-                            opt_data = strike_node.get(k)
+                        node = strike_node.get(k)
+                        if isinstance(node, dict) and node:
+                            opt_data = node
                             break
 
                     security_id = self._extract_security_id(opt_data)
@@ -448,8 +723,7 @@ class DhanAPI:
                     available_strikes = list(oc_data.keys())[:10]
                 elif isinstance(oc_data, list):
                     available_strikes = [
-                        (x.get('strike_price') or x.get('strikePrice') or x.get('strike'))
-                        for x in oc_data[:10] if isinstance(x, dict)
+                        _first_of(x, _STRIKE_KEYS) for x in oc_data[:10] if isinstance(x, dict)
                     ]
                 else:
                     available_strikes = []
@@ -469,7 +743,7 @@ class DhanAPI:
         """Get option LTP from cache or API"""
         try:
             index_config = get_index_config(index_name)
-            fno_segment = index_config.get("fno_segment", "NSE_FNO")
+            fno_segment = index_config.fno_segment
             
             # First try from cached option chain
             if strike and option_type:
@@ -495,10 +769,7 @@ class DhanAPI:
             })
             
             if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, dict) and 'data' in data:
-                    data = data.get('data', {})
-                
+                data = self._unwrap(response)
                 fno_data = data.get(fno_segment, {}).get(str(security_id), {})
                 if fno_data:
                     ltp = fno_data.get('last_price')
@@ -509,37 +780,47 @@ class DhanAPI:
             logger.error(f"Error fetching option LTP: {e}")
         return 0
     
-    async def place_order(self, security_id: str, transaction_type: str, qty: int, index_name: str = None) -> dict:
+    def _resolve_exchange_segment(self, index_name: str) -> object:
+        """Resolve (once per index) the SDK exchange segment used for orders."""
+        cached = self._segment_by_index.get(index_name)
+        if cached is not None:
+            return cached
+
+        resolved_segment = self._default_exchange_segment
+        try:
+            index_config = get_index_config(index_name)
+            if not index_config:
+                raise ValueError(f"Unknown index: {index_name}")
+            segment_key = index_config.fno_segment
+            if segment_key:
+                # Try exact attribute name first, then uppercase for config/SDK inconsistencies.
+                resolved_segment = getattr(self.dhan, segment_key, None)
+                if resolved_segment is None:
+                    resolved_segment = getattr(self.dhan, segment_key.upper(), None)
+                if resolved_segment is None:
+                    resolved_segment = self._default_exchange_segment
+                    logger.warning(
+                        f"[ORDER] Unknown segment '{segment_key}' for {index_name}; using {DEFAULT_FNO_SEGMENT} "
+                        "(orders will likely fail for BSE indices like SENSEX; verify index config)"
+                    )
+        except Exception as e:
+            logger.warning(f"[ORDER] Falling back to {DEFAULT_FNO_SEGMENT} segment for {index_name}: {e}")
+            return self._default_exchange_segment
+
+        self._segment_by_index[index_name] = resolved_segment
+        return resolved_segment
+
+    async def place_order(self, security_id: str, transaction_type: str, qty: int, index_name: str = None) -> OrderResult:
         """Place a market order synchronously (Dhan API is synchronous)"""
         try:
-            import asyncio
             if not self._segment_ready:
-                return {
-                    "status": "error",
-                    "message": f"Dhan API missing segment attribute: {DEFAULT_FNO_SEGMENT}",
-                    "orderId": None
-                }
+                return OrderResult(
+                    status="error",
+                    message=f"Dhan API missing segment attribute: {DEFAULT_FNO_SEGMENT}",
+                )
             exchange_segment = self._default_exchange_segment
             if index_name:
-                try:
-                    index_config = get_index_config(index_name)
-                    if not index_config:
-                        raise ValueError(f"Unknown index: {index_name}")
-                    segment_key = index_config.get("fno_segment")
-                    if segment_key:
-                        # Try exact attribute name first, then uppercase for config/SDK inconsistencies.
-                        resolved_segment = getattr(self.dhan, segment_key, None)
-                        if resolved_segment is None:
-                            resolved_segment = getattr(self.dhan, segment_key.upper(), None)
-                        if resolved_segment is None:
-                            resolved_segment = self._default_exchange_segment
-                            logger.warning(
-                                f"[ORDER] Unknown segment '{segment_key}' for {index_name}; using {DEFAULT_FNO_SEGMENT} "
-                                "(orders will likely fail for BSE indices like SENSEX; verify index config)"
-                            )
-                        exchange_segment = resolved_segment
-                except Exception as e:
-                    logger.warning(f"[ORDER] Falling back to {DEFAULT_FNO_SEGMENT} segment for {index_name}: {e}")
+                exchange_segment = self._resolve_exchange_segment(index_name)
 
             # Dhan SDK call is synchronous; run in a thread to avoid blocking the event loop.
             response = await asyncio.to_thread(
@@ -556,7 +837,7 @@ class DhanAPI:
             # Validate response
             if not response:
                 logger.error(f"[ORDER] Empty response from Dhan API for {transaction_type} order, qty={qty}")
-                return {"status": "error", "message": "Empty response from Dhan", "orderId": None}
+                return OrderResult(status="error", message="Empty response from Dhan")
 
             logger.debug(f"[ORDER] Raw Dhan {transaction_type} response: {response}")
 
@@ -566,63 +847,152 @@ class DhanAPI:
                 resp_status = response.get('status', '')
 
                 # Unwrap nested data payload if present
-                data_payload = response.get('data', {})
-                if isinstance(data_payload, dict) and 'data' in data_payload:
-                    data_payload = data_payload['data']
+                data_payload = self._unwrap(response)
 
                 # Prefer nested data first, then top-level keys
-                order_id = (
-                    (data_payload.get('orderId') if isinstance(data_payload, dict) else None)
-                    or response.get('orderId')
-                    or response.get('order_id')
-                    or response.get('id')
-                    or (data_payload.get('order_id') if isinstance(data_payload, dict) else None)
-                )
+                order_id = None
+                sources = (data_payload, response) if isinstance(data_payload, dict) else (response,)
+                for src in sources:
+                    for k in _ORDERID_KEYS:
+                        order_id = src.get(k)
+                        if order_id:
+                            break
+                    if order_id:
+                        break
 
                 if order_id:
+                    self.invalidate_positions()
                     logger.info(
                         f"[ORDER] {transaction_type} order placed | "
                         f"OrderID: {order_id} | Security: {security_id} | Qty: {qty}"
                     )
-                    return {
-                        "status": "success",
-                        "orderId": str(order_id),
-                        "price": 0,  # fill price not available at placement; use verify_order_filled
-                        "quantity": qty,
-                        "data": response,
-                    }
+                    return OrderResult(
+                        status="success",
+                        order_id=str(order_id),
+                        price=0.0,  # fill price not available at placement; use verify_order_filled
+                        quantity=qty,
+                        raw=response,
+                    )
 
                 if resp_status == 'success':
+                    self.invalidate_positions()
                     # Success but no orderId found -- log full response for debugging
                     logger.warning(
                         f"[ORDER] {transaction_type} order status=success but no orderId found | "
                         f"Full response: {response}"
                     )
-                    return {
-                        "status": "success",
-                        "orderId": "UNKNOWN",
-                        "price": 0,
-                        "quantity": qty,
-                        "data": response,
-                    }
+                    return OrderResult(
+                        status="success",
+                        order_id="UNKNOWN",
+                        quantity=qty,
+                        raw=response,
+                    )
 
             logger.error(f"[ORDER] Unexpected response format for {transaction_type}: {response}")
-            return {"status": "error", "message": f"Unexpected response: {response}", "orderId": None}
+            return OrderResult(status="error", message=f"Unexpected response: {response}")
             
         except Exception as e:
             logger.error(f"[ORDER] Error placing {transaction_type} order: {e}", exc_info=True)
-            return {"status": "error", "message": str(e), "orderId": None}
+            return OrderResult(status="error", message=str(e))
     
     async def get_positions(self) -> list:
-        """Get current positions"""
+        """Get current positions (memoized for a short TTL across callers).
+
+        Raises if the broker call fails, so callers can tell "flat" from
+        "could not check".
+        """
+        cached = self._positions_cache
+        if cached is not None and time.monotonic() - cached[0] < self._positions_cache_ttl:
+            return cached[1]
         try:
-            response = self.dhan.get_positions()
-            if response and 'data' in response:
-                return response.get('data', [])
+            response = await asyncio.to_thread(self.dhan.get_positions)
         except Exception as e:
             logger.error(f"Error fetching positions: {e}")
-        return []    
-    async def verify_order_filled(self, order_id: str, security_id: str, expected_qty: int, timeout_seconds: int = 30) -> dict:
+            raise
+        positions = []
+        if isinstance(response, dict):
+            positions = response.get('data', []) or []
+        elif isinstance(response, list):
+            positions = response
+        self._positions_cache = (time.monotonic(), positions)
+        return positions
+
+    def invalidate_positions(self) -> None:
+        """Drop memoized positions (call after an order changes them)."""
+        self._positions_cache = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for direct Dhan REST calls."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=DHAN_API_BASE,
+                headers={
+                    "access-token": self.access_token,
+                    "client-id": str(self.client_id),
+                    "Accept": "application/json",
+                },
+                timeout=5.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60.0),
+            )
+        return self._http
+
+    async def _get_order(self, order_id: str) -> dict:
+        """Fetch one order straight from the Dhan REST API (no SDK thread hop).
+
+        Returns the same {'status', 'remarks', 'data'} shape as the SDK.
+        """
+        r = await self._http_client().get(f"/orders/{order_id}")
+        if r.status_code != 200:
+            return {'status': 'failure', 'remarks': f"HTTP {r.status_code}: {r.text[:200]}", 'data': ''}
+        data = r.json()
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        return {'status': 'success', 'remarks': '', 'data': data}
+
+    async def close(self) -> None:
+        """Close the shared HTTP client (safe to call repeatedly)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _dhan_call(self, fn, *args):
+        """Run an order-status call (blocking SDK method or coroutine) through the circuit breaker.
+
+        Raises CircuitOpenError without calling Dhan while the breaker is open.
+        Only a 'success' response counts as success. Throttling, 5xx and
+        transport failures (raised or returned as failure dicts) count as
+        failures; 4xx client errors such as "order not found yet" count as
+        neither.
+        """
+        self._order_breaker.before_call()
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                resp = await fn(*args)
+            else:
+                resp = await asyncio.to_thread(fn, *args)
+        except Exception:
+            self._order_breaker.on_failure()
+            raise
+        if isinstance(resp, dict) and resp.get('status') == 'success':
+            self._order_breaker.on_success()
+        elif _is_throttled(resp) or not _is_client_error(resp):
+            self._order_breaker.on_failure()
+        else:
+            self._order_breaker.on_ignored()
+        return resp
+
+    async def _get_order_list_cached(self):
+        """get_order_list via the circuit breaker, reused for _ol_cache_ttl seconds."""
+        async with self._ol_lock:
+            cached = self._ol_cache
+            if cached is not None and time.monotonic() - cached[0] < self._ol_cache_ttl:
+                return cached[1]
+            resp = await self._dhan_call(self.dhan.get_order_list)
+            self._ol_cache = (time.monotonic(), resp)
+            return resp
+
+    async def verify_order_filled(self, order_id: str, security_id: str, expected_qty: int, timeout_seconds: int = 30) -> OrderResult:
         """Verify if an order was actually filled by polling the Dhan order list.
 
         Dhan API v2 order statuses:
@@ -630,135 +1000,123 @@ class DhanAPI:
           Filled         : TRADED (full fill), PART_TRADED (partial fill)
           Terminal       : CANCELLED, REJECTED, EXPIRED
 
+        Returns status BROKER_UNAVAILABLE (not filled, order state unknown) without
+        polling while the order-API circuit breaker is open.
+
         For market orders during live hours TRADED typically arrives within 1-3 seconds.
         PART_TRADED means some qty was filled -- we accept that as a usable fill.
 
         Returns:
-            {
-                "filled": bool,
-                "order_id": str,
-                "status": str,
-                "filled_qty": int,
-                "average_price": float,
-                "message": str
-            }
+            OrderResult with `filled`, `status`, `message`, the filled qty in
+            `quantity` and the average fill price in `price`.
         """
-        import asyncio
 
-        # Dhan v2 status sets
-        FILLED_STATUSES   = {'TRADED', 'COMPLETE', 'COMPLETED', 'FILLED'}
-        PARTIAL_STATUSES  = {'PART_TRADED', 'PARTIALLY_TRADED', 'PARTIAL'}
-        OPEN_STATUSES     = {'TRANSIT', 'PENDING', 'OPEN', 'AFTER_MARKET_ORDER_REQ_RECEIVED', 'AMO_REQ_RECEIVED'}
-        REJECTED_STATUSES = {'REJECTED'}
-        CANCEL_STATUSES   = {'CANCELLED', 'EXPIRED', 'CANCELPENDING'}
+        # Resolved once: skips building debug-only log args on every poll
+        debug = logger.isEnabledFor(logging.DEBUG)
 
+        self._inflight_verifications += 1
         try:
-            start_time = datetime.now(timezone.utc)
+            start_time = time.monotonic()  # elapsed-time math only; immune to wall-clock steps
             retry_count = 0
             last_log_time = start_time
 
             while True:
                 retry_count += 1
-                elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
+                elapsed = time.monotonic() - start_time
 
                 if elapsed > timeout_seconds:
                     logger.warning(
                         f"[ORDER] x Order {order_id} not confirmed after {timeout_seconds}s "
                         f"(attempt #{retry_count}) -- treating as not filled"
                     )
-                    return {
-                        "filled": False,
-                        "order_id": order_id,
-                        "status": "TIMEOUT",
-                        "filled_qty": 0,
-                        "average_price": 0,
-                        "message": f"Order not confirmed within {timeout_seconds}s",
-                    }
-
-                if (datetime.now(timezone.utc) - last_log_time).total_seconds() >= 10:
+                    return OrderResult(
+                        status="TIMEOUT",
+                        order_id=order_id,
+                        filled=False,
+                        message=f"Order not confirmed within {timeout_seconds}s",
+                    )
+
+                if time.monotonic() - last_log_time >= 10:
                     logger.info(
-                        f"[ORDER] Waiting for order {order_id} to fill... "
-                        f"({elapsed:.0f}s elapsed, attempt #{retry_count})"
+                        "[ORDER] Waiting for order %s to fill... (%.0fs elapsed, attempt #%d)",
+                        order_id, elapsed, retry_count,
                     )
-                    last_log_time = datetime.now(timezone.utc)
+                    last_log_time = time.monotonic()
 
+                throttled = False
+                # With several orders in flight, poll them all off one shared list scan
+                shared_scan = self._inflight_verifications > 1
                 try:
-                    # --- Primary: get_order_by_id (single order, faster + less bandwidth) ---
+                    # --- Primary: GET /orders/{id} (single order, faster + less bandwidth) ---
                     order = None
-                    try:
-                        resp = await asyncio.to_thread(self.dhan.get_order_by_id, order_id)
-                        if resp and resp.get('status') == 'success':
-                            data = resp.get('data', {})
-                            # Dhan sometimes nests: {'data': {'data': {...}}}
-                            if isinstance(data, dict) and 'data' in data and isinstance(data['data'], dict):
-                                data = data['data']
-                            if isinstance(data, dict) and data.get('orderId'):
-                                order = data
-                    except Exception:
-                        pass  # Fall through to full order list scan
-
-                    # --- Fallback: scan full order list ---
-                    if order is None:
-                        orders_resp = await asyncio.to_thread(self.dhan.get_order_list)
-                        if orders_resp and 'data' in orders_resp:
-                            raw = orders_resp['data']
-                            # Unwrap nested data if present
-                            if isinstance(raw, dict) and 'data' in raw:
-                                raw = raw['data']
-                            if isinstance(raw, list):
-                                for o in raw:
-                                    if str(o.get('orderId')) == str(order_id):
-                                        order = o
-                                        break
+                    if not shared_scan:
+                        try:
+                            resp = await self._dhan_call(self._get_order, order_id)
+                            if resp and resp.get('status') == 'success':
+                                # Dhan sometimes nests: {'data': {'data': {...}}}
+                                data = self._unwrap(resp)
+                                if isinstance(data, dict) and data.get('orderId'):
+                                    order = data
+                            elif resp:
+                                throttled = _is_throttled(resp)
+                        except CircuitOpenError:
+                            raise
+                        except Exception as e:
+                            throttled = _is_throttled(e)  # Fall through to full order list scan
+
+                    # --- Fallback: shared order-list scan (large payload; only every Nth
+                    # attempt unless several orders are being verified at once) ---
+                    if order is None and not throttled and (shared_scan or retry_count % _ORDER_LIST_EVERY == 0):
+                        order = await self._order_poller.fetch(order_id)
 
                     if order is None:
                         # Order not visible yet -- TRANSIT state can lag by 1-2s
-                        logger.debug(
-                            f"[ORDER] {order_id} not in order list yet "
-                            f"(attempt #{retry_count}, {elapsed:.1f}s)"
-                        )
-                        await asyncio.sleep(0.5)
+                        if debug:
+                            logger.debug(
+                                "[ORDER] %s not in order list yet (attempt #%d, %.1fs)",
+                                order_id, retry_count, elapsed,
+                            )
+                        await asyncio.sleep(_poll_delay(retry_count, throttled))
                         continue
 
                     # --- Parse order fields (Dhan v2 field names) ---
-                    raw_status = str(
-                        order.get('orderStatus') or order.get('status') or ''
-                    ).strip().upper()
-
-                    filled_qty = 0
-                    try:
-                        filled_qty = int(
-                            order.get('filledQty')
-                            or order.get('filled_qty')
-                            or order.get('tradedQuantity')
-                            or 0
+                    raw_status = str(_first_truthy(order, _ORDER_STATUS_KEYS, '')).strip().upper()
+
+                    # --- Terminal: rejected (fill fields are unused) ---
+                    if raw_status in REJECTED_STATUSES:
+                        # Dhan v2 uses 'rejectionReason' (not 'reason')
+                        rejection_reason = _first_truthy(order, _REJECTION_KEYS, 'Unknown')
+                        logger.error(
+                            f"[ORDER] x Order {order_id} REJECTED | "
+                            f"Reason: {rejection_reason}"
                         )
-                    except Exception:
-                        filled_qty = 0
-
-                    average_price = 0.0
-                    try:
-                        average_price = float(
-                            order.get('averagePrice')
-                            or order.get('average_price')
-                            or order.get('tradedPrice')
-                            or 0
+                        return OrderResult(
+                            status="REJECTED",
+                            order_id=order_id,
+                            filled=False,
+                            message=f"Order rejected: {rejection_reason}",
                         )
-                    except Exception:
-                        average_price = 0.0
-
-                    # Dhan v2 uses 'rejectionReason' (not 'reason')
-                    rejection_reason = (
-                        order.get('rejectionReason')
-                        or order.get('reason')
-                        or order.get('rejection_reason')
-                        or 'Unknown'
-                    )
 
-                    logger.debug(
-                        f"[ORDER] Poll #{retry_count} | ID={order_id} | "
-                        f"Status={raw_status} | FilledQty={filled_qty} | AvgPrice={average_price}"
-                    )
+                    filled_qty = _safe_num(order, _FILLED_QTY_KEYS, int, 0)
+                    average_price = _safe_num(order, _AVG_PRICE_KEYS, float, 0.0)
+
+                    # --- Terminal: cancelled / expired (report any partial fill) ---
+                    if raw_status in CANCEL_STATUSES:
+                        logger.warning(f"[ORDER] x Order {order_id} {raw_status}")
+                        return OrderResult(
+                            status=raw_status,
+                            order_id=order_id,
+                            quantity=filled_qty,
+                            price=average_price,
+                            filled=False,
+                            message=f"Order {raw_status.lower()}",
+                        )
+
+                    if debug:
+                        logger.debug(
+                            "[ORDER] Poll #%d | ID=%s | Status=%s | FilledQty=%d | AvgPrice=%s",
+                            retry_count, order_id, raw_status, filled_qty, average_price,
+                        )
 
                     # --- Fully filled ---
                     if raw_status in FILLED_STATUSES:
@@ -766,14 +1124,14 @@ class DhanAPI:
                             f"[ORDER] + Order {order_id} TRADED (fully filled) | "
                             f"FilledQty={filled_qty} | AvgPrice={average_price} | attempt #{retry_count}"
                         )
-                        return {
-                            "filled": True,
-                            "order_id": order_id,
-                            "status": "TRADED",
-                            "filled_qty": filled_qty,
-                            "average_price": average_price,
-                            "message": f"Order fully filled at avg price {average_price}",
-                        }
+                        return OrderResult(
+                            status="TRADED",
+                            order_id=order_id,
+                            quantity=filled_qty,
+                            price=average_price,
+                            filled=True,
+                            message=f"Order fully filled at avg price {average_price}",
+                        )
 
                     # --- Partially filled -- keep polling, accept when full qty reached ---
                     if raw_status in PARTIAL_STATUSES:
@@ -782,79 +1140,66 @@ class DhanAPI:
                                 f"[ORDER] + Order {order_id} PART_TRADED (full qty reached via partials) | "
                                 f"FilledQty={filled_qty} | AvgPrice={average_price}"
                             )
-                            return {
-                                "filled": True,
-                                "order_id": order_id,
-                                "status": "PART_TRADED",
-                                "filled_qty": filled_qty,
-                                "average_price": average_price,
-                                "message": f"Partial fills completed full qty at avg {average_price}",
-                            }
-                        logger.debug(
-                            f"[ORDER] PART_TRADED in progress | "
-                            f"FilledQty={filled_qty}/{expected_qty} | {elapsed:.1f}s"
-                        )
-                        await asyncio.sleep(0.5)
+                            return OrderResult(
+                                status="PART_TRADED",
+                                order_id=order_id,
+                                quantity=filled_qty,
+                                price=average_price,
+                                filled=True,
+                                message=f"Partial fills completed full qty at avg {average_price}",
+                            )
+                        if debug:
+                            logger.debug(
+                                "[ORDER] PART_TRADED in progress | FilledQty=%d/%d | %.1fs",
+                                filled_qty, expected_qty, elapsed,
+                            )
+                        await asyncio.sleep(_poll_delay(retry_count, throttled))
                         continue
 
                     # --- Still open / in-flight ---
                     if raw_status in OPEN_STATUSES:
-                        logger.debug(
-                            f"[ORDER] Order {order_id} still open | "
-                            f"Status={raw_status} | {elapsed:.1f}s elapsed"
-                        )
-                        await asyncio.sleep(0.5)
+                        if debug:
+                            logger.debug(
+                                "[ORDER] Order %s still open | Status=%s | %.1fs elapsed",
+                                order_id, raw_status, elapsed,
+                            )
+                        await asyncio.sleep(_poll_delay(retry_count, throttled))
                         continue
 
-                    # --- Terminal: rejected ---
-                    if raw_status in REJECTED_STATUSES:
-                        logger.error(
-                            f"[ORDER] x Order {order_id} REJECTED | "
-                            f"Reason: {rejection_reason}"
-                        )
-                        return {
-                            "filled": False,
-                            "order_id": order_id,
-                            "status": "REJECTED",
-                            "filled_qty": 0,
-                            "average_price": 0,
-                            "message": f"Order rejected: {rejection_reason}",
-                        }
-
-                    # --- Terminal: cancelled / expired ---
-                    if raw_status in CANCEL_STATUSES:
-                        logger.warning(f"[ORDER] x Order {order_id} {raw_status}")
-                        return {
-                            "filled": False,
-                            "order_id": order_id,
-                            "status": raw_status,
-                            "filled_qty": filled_qty,
-                            "average_price": average_price,
-                            "message": f"Order {raw_status.lower()}",
-                        }
-
                     # Unknown status -- log and keep polling until timeout
                     logger.warning(
                         f"[ORDER] Unrecognised order status '{raw_status}' for {order_id} -- "
                         f"continuing to poll (attempt #{retry_count}, {elapsed:.1f}s)"
                     )
-                    await asyncio.sleep(0.5)
+                    await asyncio.sleep(_poll_delay(retry_count, throttled))
+
+                except CircuitOpenError:
+                    logger.warning(
+                        f"[ORDER] x Order {order_id} status unknown -- Dhan order API unavailable "
+                        f"(circuit open, attempt #{retry_count})"
+                    )
+                    return OrderResult(
+                        status="BROKER_UNAVAILABLE",
+                        order_id=order_id,
+                        filled=False,
+                        message="Dhan order API unavailable (circuit breaker open)",
+                    )
 
                 except Exception as e:
-                    elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
+                    elapsed = time.monotonic() - start_time
                     logger.debug(
                         f"[ORDER] Error polling order {order_id}: {e} "
                         f"(attempt #{retry_count}, {elapsed:.1f}s)"
                     )
-                    await asyncio.sleep(0.5)
+                    await asyncio.sleep(_poll_delay(retry_count, throttled))
 
         except Exception as e:
             logger.error(f"[ORDER] Fatal error in verify_order_filled: {e}", exc_info=True)
-            return {
-                "filled": False,
-                "order_id": order_id,
-                "status": "ERROR",
-                "filled_qty": 0,
-                "average_price": 0,
-                "message": str(e),
-            }
\ No newline at end of file
+            return OrderResult(
+                status="ERROR",
+                order_id=order_id,
+                filled=False,
+                message=str(e),
+            )
+        finally:
+            self._inflight_verifications -= 1
\ No newline at end of file
@@ -1,138 +1,263 @@
 # Multiple Trading Indicators
 import logging
+from collections import deque
+from math import sqrt
+
+from indicators_kernels import (
+    ema_update,
+    rsi_from_averages,
+    supertrend_step,
+    true_range,
+    wilder_update,
+)
 
 logger = logging.getLogger(__name__)
 
+# Indicator outputs kept for telemetry/inspection (older values are dropped)
+HISTORY_LEN = 100
+
+
+def _ema_coefficients(period):
+    """Validate an EMA period and return (alpha, 1 - alpha)."""
+    period = int(period)
+    if period <= 0:
+        raise ValueError(f"EMA period must be positive, got {period}")
+    alpha = 2 / (period + 1)
+    return alpha, 1.0 - alpha
+
+
+def _update_ema(current_ema, value, period, alpha, one_minus_alpha, seed_list):
+    """Incremental EMA update with SMA seeding (coefficients from _ema_coefficients)."""
+    if current_ema is None:
+        seed_list.append(value)
+        if len(seed_list) < period:
+            return None
+        if len(seed_list) == period:
+            return sum(seed_list) / period
+        # Should not normally exceed, but keep stable if it does
+        return sum(seed_list[-period:]) / period
+    return ema_update(current_ema, value, alpha, one_minus_alpha)
+
+
+def _peek_ema(current_ema, value, period, alpha, one_minus_alpha, seed_list):
+    """What _update_ema() would return for `value`, without appending to seed_list."""
+    if current_ema is None:
+        n = len(seed_list) + 1
+        if n < period:
+            return None
+        return (sum(seed_list[n - period:]) + value) / period
+    return ema_update(current_ema, value, alpha, one_minus_alpha)
+
+
+class _RollingExtreme:
+    """Sliding-window max (or min) over the last `size` values.
+
+    Monotonic deque of (index, value): amortized O(1) per push instead of
+    rescanning the window with max()/min().
+    """
+    def __init__(self, size, is_max=True):
+        self.size = size
+        self.is_max = is_max
+        self._dq = deque()
+        self._i = 0
+
+    def reset(self):
+        self._dq.clear()
+        self._i = 0
+
+    def push(self, value):
+        """Add a value and return the extreme of the current window."""
+        dq = self._dq
+        if self.is_max:
+            while dq and dq[-1][1] <= value:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] >= value:
+                dq.pop()
+        dq.append((self._i, value))
+        expired = self._i - self.size
+        while dq[0][0] <= expired:
+            dq.popleft()
+        self._i += 1
+        return dq[0][1]
+
+
+class CandleFeed:
+    """Latest two candles of one series, with true range computed once per push.
+
+    Indicators fed the same candles share one feed: push() each candle once,
+    then call update(feed) on every subscribed indicator (each one must see
+    every push). Only the current and previous candle are ever read, so the
+    "ring" is just those two rows kept as scalar columns.
+    """
+    __slots__ = ('high', 'low', 'close', 'prev_high', 'prev_low', 'prev_close', 'tr', 'count')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.high = self.low = self.close = None
+        self.prev_high = self.prev_low = self.prev_close = None
+        self.tr = 0.0
+        self.count = 0
+
+    def push(self, high, low, close):
+        """Append a candle and precompute its true range."""
+        self.prev_high, self.prev_low, self.prev_close = self.high, self.low, self.close
+        self.high, self.low, self.close = high, low, close
+        prev_close = self.prev_close
+        self.tr = high - low if prev_close is None else true_range(high, low, prev_close)
+        self.count += 1
+
+
 class SuperTrend:
     def __init__(self, period=7, multiplier=4):
         self.period = period
         self.multiplier = multiplier
-        self.candles = []
-        self.atr_values = []
-        self.supertrend_values = []
         self.direction = 1  # 1 = GREEN (bullish), -1 = RED (bearish)
+        self._period_m1 = period - 1
+        self._feed = CandleFeed()  # private feed for standalone add_candle() use
+        self._reset_state()
     
+    def _reset_state(self):
+        # Scalar (struct-of-arrays style) state: only the previous candle's
+        # close (read from the feed), ATR and final bands are ever read.
+        self._feed.reset()
+        self._count = 0
+        self._tr_seed_sum = 0.0
+        self._atr = None
+        self._final_upper = None
+        self._final_lower = None
+        self.last_value = None
+
     def reset(self):
         """Reset indicator state"""
-        self.candles = []
-        self.atr_values = []
-        self.supertrend_values = []
         self.direction = 1
+        self._reset_state()
+
+    @property
+    def ready(self) -> bool:
+        """True once `period` candles have been consumed."""
+        return self._count >= self.period
     
     def add_candle(self, high, low, close):
         """Add a new candle and calculate SuperTrend"""
-        self.candles.append({'high': high, 'low': low, 'close': close})
-        
-        if len(self.candles) < self.period:
-            return None, None
-        
-        # Calculate True Range
-        tr = max(
-            high - low,
-            abs(high - self.candles[-2]['close']) if len(self.candles) > 1 else 0,
-            abs(low - self.candles[-2]['close']) if len(self.candles) > 1 else 0
-        )
-        
+        self._feed.push(high, low, close)
+        return self.update(self._feed)
+
+    def update(self, feed):
+        """Calculate SuperTrend for the candle just pushed onto `feed`"""
+        high, low, close = feed.high, feed.low, feed.close
+        prev_close = feed.prev_close
+        # True Range (precomputed by the feed; first candle after a reset has no prior close)
+        tr = feed.tr if self._count else high - low
+        self._count += 1
+
         # Calculate ATR
-        if len(self.atr_values) == 0:
-            # Initial ATR is simple average of TR
-            trs = []
-            for i in range(max(0, len(self.candles) - self.period), len(self.candles)):
-                if i > 0:
-                    prev = self.candles[i-1]
-                    curr = self.candles[i]
-                    tr_val = max(
-                        curr['high'] - curr['low'],
-                        abs(curr['high'] - prev['close']),
-                        abs(curr['low'] - prev['close'])
-                    )
-                else:
-                    tr_val = self.candles[i]['high'] - self.candles[i]['low']
-                trs.append(tr_val)
-            atr = sum(trs) / len(trs) if trs else 0
-        else:
-            atr = (self.atr_values[-1] * (self.period - 1) + tr) / self.period
-        
-        self.atr_values.append(atr)
-        
-        # Calculate basic upper and lower bands
-        hl2 = (high + low) / 2
-        basic_upper = hl2 + (self.multiplier * atr)
-        basic_lower = hl2 - (self.multiplier * atr)
-        
-        # Final bands calculation
-        if len(self.supertrend_values) == 0:
-            final_upper = basic_upper
-            final_lower = basic_lower
-        else:
-            prev = self.supertrend_values[-1]
-            prev_close = self.candles[-2]['close']
-            
-            final_lower = basic_lower if basic_lower > prev['lower'] or prev_close < prev['lower'] else prev['lower']
-            final_upper = basic_upper if basic_upper < prev['upper'] or prev_close > prev['upper'] else prev['upper']
-        
-        # Direction
-        if len(self.supertrend_values) == 0:
-            direction = 1 if close > final_upper else -1
+        period = self.period
+        if self._atr is None:
+            # Initial ATR is simple average of TR over the first `period` candles
+            self._tr_seed_sum += tr
+            if self._count < period:
+                return None, None
+            atr = self._tr_seed_sum / period
         else:
-            prev = self.supertrend_values[-1]
-            if prev['direction'] == 1:
-                direction = -1 if close < final_lower else 1
-            else:
-                direction = 1 if close > final_upper else -1
+            atr = wilder_update(self._atr, tr, self._period_m1, period)
+        self._atr = atr
+        
+        # Basic/final bands and direction
+        has_prev = self._final_upper is not None
+        final_upper, final_lower, direction = supertrend_step(
+            high, low, close,
+            prev_close if has_prev else 0.0,
+            atr, float(self.multiplier),
+            self._final_upper if has_prev else 0.0,
+            self._final_lower if has_prev else 0.0,
+            self.direction, has_prev,
+        )
         
+        self._final_upper = final_upper
+        self._final_lower = final_lower
         self.direction = direction
         supertrend_value = final_lower if direction == 1 else final_upper
-        
-        self.supertrend_values.append({
-            'upper': final_upper,
-            'lower': final_lower,
-            'value': supertrend_value,
-            'direction': direction
-        })
-        
-        # Keep only last 100 values
-        if len(self.candles) > 100:
-            self.candles = self.candles[-100:]
-            self.atr_values = self.atr_values[-100:]
-            self.supertrend_values = self.supertrend_values[-100:]
+        self.last_value = supertrend_value
         
         signal = "GREEN" if direction == 1 else "RED"
         return supertrend_value, signal
 
+    def peek_candle(self, high, low, close):
+        """Return (value, direction) that add_candle() would produce for this
+        candle, without consuming it. direction is 1/-1, or 0 while warming up."""
+        prev_close = self._feed.close
+        tr = true_range(high, low, prev_close) if self._count else high - low
+
+        period = self.period
+        if self._atr is None:
+            if self._count + 1 < period:
+                return None, 0
+            atr = (self._tr_seed_sum + tr) / period
+        else:
+            atr = wilder_update(self._atr, tr, self._period_m1, period)
+
+        has_prev = self._final_upper is not None
+        final_upper, final_lower, direction = supertrend_step(
+            high, low, close,
+            prev_close if has_prev else 0.0,
+            atr, float(self.multiplier),
+            self._final_upper if has_prev else 0.0,
+            self._final_lower if has_prev else 0.0,
+            self.direction, has_prev,
+        )
+        supertrend_value = final_lower if direction == 1 else final_upper
+        return supertrend_value, direction
+
 class RSI:
-    """Relative Strength Index Indicator"""
+    """Relative Strength Index Indicator (Wilder smoothing, O(1) per candle)"""
     def __init__(self, period=14):
         self.period = period
-        self.closes = []
-        self.rsi_values = []
+        self.rsi_values = deque(maxlen=HISTORY_LEN)
+        self._period_m1 = period - 1
+
+        self._prev_close = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0  # number of close-to-close changes seen
     
     def reset(self):
-        self.closes = []
-        self.rsi_values = []
+        self.rsi_values.clear()
+
+        self._prev_close = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0
     
     def add_candle(self, high, low, close):
         """Add candle and calculate RSI"""
-        self.closes.append(close)
-        
-        if len(self.closes) < self.period + 1:
+        prev_close = self._prev_close
+        self._prev_close = close
+        if prev_close is None:
             return None, None
-        
-        # Calculate gains and losses
-        gains = []
-        losses = []
-        for i in range(1, len(self.closes)):
-            change = self.closes[i] - self.closes[i-1]
-            gains.append(max(0, change))
-            losses.append(max(0, -change))
-        
-        # Average gain and loss
-        avg_gain = sum(gains[-self.period:]) / self.period if self.period > 0 else 0
-        avg_loss = sum(losses[-self.period:]) / self.period if self.period > 0 else 0
-        
+
+        change = close - prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        period = self.period
+        self._count += 1
+
+        if self._count <= period:
+            # Seed: SMA of the first `period` changes
+            self._avg_gain += gain / period
+            self._avg_loss += loss / period
+            if self._count < period:
+                return None, None
+        else:
+            # Wilder's smoothing
+            period_m1 = self._period_m1
+            self._avg_gain = wilder_update(self._avg_gain, gain, period_m1, period)
+            self._avg_loss = wilder_update(self._avg_loss, loss, period_m1, period)
+
         # RS and RSI
-        rs = avg_gain / avg_loss if avg_loss > 0 else 0
-        rsi = 100 - (100 / (1 + rs)) if rs > 0 else 50
+        rsi = rsi_from_averages(self._avg_gain, self._avg_loss)
         
         self.rsi_values.append(rsi)
         
@@ -153,14 +278,19 @@ class MACD:
         self.fast = fast
         self.slow = slow
         self.signal_period = signal
-        self.closes = []
-        self.macd_values = []
+        self.macd_values = deque(maxlen=HISTORY_LEN)
+
+        # EMA coefficients are fixed per instance; validate and compute once
+        self._alpha_fast, self._beta_fast = _ema_coefficients(fast)
+        self._alpha_slow, self._beta_slow = _ema_coefficients(slow)
+        self._alpha_sig, self._beta_sig = _ema_coefficients(signal)
 
         # Latest computed values (for entry confirmation & telemetry)
         self.last_macd = None
         self.last_signal_line = None
         self.last_histogram = None
         self.last_cross = None
+        self.last_cross_dir = 0  # last_cross as 1 (GREEN) / -1 (RED) / 0
 
         self._fast_ema = None
         self._slow_ema = None
@@ -173,13 +303,13 @@ class MACD:
         self._last_relation = None  # 1 bullish (macd>=signal), -1 bearish
     
     def reset(self):
-        self.closes = []
-        self.macd_values = []
+        self.macd_values.clear()
 
         self.last_macd = None
         self.last_signal_line = None
         self.last_histogram = None
         self.last_cross = None
+        self.last_cross_dir = 0
 
         self._fast_ema = None
         self._slow_ema = None
@@ -191,44 +321,34 @@ class MACD:
 
         self._last_relation = None
     
-    def _update_ema(self, current_ema, value, period, seed_list):
-        """Incremental EMA update with SMA seeding."""
-        if period <= 0:
-            return None
-
-        alpha = 2 / (period + 1)
-        if current_ema is None:
-            seed_list.append(value)
-            if len(seed_list) < period:
-                return None
-            if len(seed_list) == period:
-                return sum(seed_list) / period
-            # Should not normally exceed, but keep stable if it does
-            return sum(seed_list[-period:]) / period
-        return value * alpha + current_ema * (1 - alpha)
-    
     def add_candle(self, high, low, close):
         """Add candle and calculate MACD"""
-        self.closes.append(close)
-
         # Update fast/slow EMAs
-        self._fast_ema = self._update_ema(self._fast_ema, close, self.fast, self._fast_seed)
-        self._slow_ema = self._update_ema(self._slow_ema, close, self.slow, self._slow_seed)
+        self._fast_ema = _update_ema(
+            self._fast_ema, close, self.fast, self._alpha_fast, self._beta_fast, self._fast_seed
+        )
+        self._slow_ema = _update_ema(
+            self._slow_ema, close, self.slow, self._alpha_slow, self._beta_slow, self._slow_seed
+        )
 
         if self._fast_ema is None or self._slow_ema is None:
             self.last_macd = None
             self.last_signal_line = None
             self.last_histogram = None
             self.last_cross = None
+            self.last_cross_dir = 0
             return None, None
 
         macd = self._fast_ema - self._slow_ema
         self.macd_values.append(macd)
 
         # Update signal line EMA over MACD values
-        self._signal_ema = self._update_ema(self._signal_ema, macd, self.signal_period, self._signal_seed)
+        self._signal_ema = _update_ema(
+            self._signal_ema, macd, self.signal_period, self._alpha_sig, self._beta_sig, self._signal_seed
+        )
 
         cross = None
+        cross_dir = 0
         histogram = None
         relation = None
 
@@ -237,51 +357,79 @@ class MACD:
             relation = 1 if macd >= self._signal_ema else -1
             if self._last_relation is not None and relation != self._last_relation:
                 cross = "GREEN" if relation == 1 else "RED"
+                cross_dir = relation
             self._last_relation = relation
 
         self.last_macd = macd
         self.last_signal_line = self._signal_ema
         self.last_histogram = histogram
         self.last_cross = cross
+        self.last_cross_dir = cross_dir
 
         return macd, cross
 
+    def peek_candle(self, high, low, close):
+        """Return (macd, signal_line, histogram, cross_dir) that add_candle() would
+        produce for this candle, without consuming it (cross_dir as last_cross_dir)."""
+        fast_ema = _peek_ema(
+            self._fast_ema, close, self.fast, self._alpha_fast, self._beta_fast, self._fast_seed
+        )
+        slow_ema = _peek_ema(
+            self._slow_ema, close, self.slow, self._alpha_slow, self._beta_slow, self._slow_seed
+        )
+        if fast_ema is None or slow_ema is None:
+            return None, None, None, 0
+
+        macd = fast_ema - slow_ema
+        signal_ema = _peek_ema(
+            self._signal_ema, macd, self.signal_period, self._alpha_sig, self._beta_sig, self._signal_seed
+        )
+        if signal_ema is None:
+            return macd, None, None, 0
+
+        relation = 1 if macd >= signal_ema else -1
+        cross_dir = 0
+        if self._last_relation is not None and relation != self._last_relation:
+            cross_dir = relation
+        return macd, signal_ema, macd - signal_ema, cross_dir
+
 
 class MovingAverage:
     """Exponential Moving Average based entries"""
     def __init__(self, fast_period=5, slow_period=20):
         self.fast_period = fast_period
         self.slow_period = slow_period
-        self.closes = []
-        self.fast_emas = []
-        self.slow_emas = []
+        self.fast_emas = deque(maxlen=HISTORY_LEN)
+        self.slow_emas = deque(maxlen=HISTORY_LEN)
+
+        self._alpha_fast, self._beta_fast = _ema_coefficients(fast_period)
+        self._alpha_slow, self._beta_slow = _ema_coefficients(slow_period)
+
+        self._fast_ema = None
+        self._slow_ema = None
+        self._fast_seed = []
+        self._slow_seed = []
     
     def reset(self):
-        self.closes = []
-        self.fast_emas = []
-        self.slow_emas = []
-    
-    def _ema(self, values, period):
-        """Calculate EMA"""
-        if len(values) < period:
-            return None
-        
-        alpha = 2 / (period + 1)
-        ema = sum(values[-period:]) / period
-        for val in values[-len(values)+period:]:
-            ema = val * alpha + ema * (1 - alpha)
-        return ema
+        self.fast_emas.clear()
+        self.slow_emas.clear()
+
+        self._fast_ema = None
+        self._slow_ema = None
+        self._fast_seed = []
+        self._slow_seed = []
     
     def add_candle(self, high, low, close):
         """Add candle and calculate moving averages"""
-        self.closes.append(close)
-        
-        if len(self.closes) < self.slow_period:
-            return None, None
-        
-        fast_ema = self._ema(self.closes, self.fast_period)
-        slow_ema = self._ema(self.closes, self.slow_period)
+        self._fast_ema = _update_ema(
+            self._fast_ema, close, self.fast_period, self._alpha_fast, self._beta_fast, self._fast_seed
+        )
+        self._slow_ema = _update_ema(
+            self._slow_ema, close, self.slow_period, self._alpha_slow, self._beta_slow, self._slow_seed
+        )
         
+        fast_ema = self._fast_ema
+        slow_ema = self._slow_ema
         if fast_ema is None or slow_ema is None:
             return None, None
         
@@ -304,24 +452,37 @@ class BollingerBands:
     def __init__(self, period=20, num_std=2):
         self.period = period
         self.num_std = num_std
-        self.closes = []
-        self.bands = []
+        self.closes = deque(maxlen=period)
+        self.bands = deque(maxlen=HISTORY_LEN)
+
+        # Rolling sum / sum-of-squares over the window held in self.closes
+        self._sum = 0.0
+        self._sum_sq = 0.0
     
     def reset(self):
-        self.closes = []
-        self.bands = []
+        self.closes.clear()
+        self.bands.clear()
+
+        self._sum = 0.0
+        self._sum_sq = 0.0
     
     def add_candle(self, high, low, close):
         """Add candle and calculate Bollinger Bands"""
+        if len(self.closes) == self.period:
+            old = self.closes[0]  # evicted by the append below
+            self._sum -= old
+            self._sum_sq -= old * old
         self.closes.append(close)
+        self._sum += close
+        self._sum_sq += close * close
         
         if len(self.closes) < self.period:
             return None, None
         
-        # Calculate SMA and std dev
-        sma = sum(self.closes[-self.period:]) / self.period
-        variance = sum((c - sma) ** 2 for c in self.closes[-self.period:]) / self.period
-        std_dev = variance ** 0.5
+        # SMA and std dev from the rolling sums (O(1) per candle)
+        sma = self._sum / self.period
+        variance = max(0.0, self._sum_sq / self.period - sma * sma)
+        std_dev = sqrt(variance)
         
         upper = sma + (std_dev * self.num_std)
         lower = sma - (std_dev * self.num_std)
@@ -344,30 +505,37 @@ class Stochastic:
     def __init__(self, k_period=14, d_period=3):
         self.k_period = k_period
         self.d_period = d_period
-        self.highs = []
-        self.lows = []
-        self.closes = []
-        self.k_values = []
+        history = k_period + d_period + 4
+        self.highs = deque(maxlen=history)
+        self.lows = deque(maxlen=history)
+        self.closes = deque(maxlen=history)
+        self.k_values = deque(maxlen=d_period)
+
+        self._highest = _RollingExtreme(k_period, is_max=True)
+        self._lowest = _RollingExtreme(k_period, is_max=False)
     
     def reset(self):
-        self.highs = []
-        self.lows = []
-        self.closes = []
-        self.k_values = []
+        self.highs.clear()
+        self.lows.clear()
+        self.closes.clear()
+        self.k_values.clear()
+
+        self._highest.reset()
+        self._lowest.reset()
     
     def add_candle(self, high, low, close):
         """Add candle and calculate Stochastic"""
         self.highs.append(high)
         self.lows.append(low)
         self.closes.append(close)
+
+        highest = self._highest.push(high)
+        lowest = self._lowest.push(low)
         
         if len(self.closes) < self.k_period:
             return None, None
         
         # Calculate K%
-        highest = max(self.highs[-self.k_period:])
-        lowest = min(self.lows[-self.k_period:])
-        
         k = ((close - lowest) / (highest - lowest) * 100) if (highest - lowest) > 0 else 50
         self.k_values.append(k)
         
@@ -375,7 +543,7 @@ class Stochastic:
         if len(self.k_values) < self.d_period:
             return k, None
         
-        d = sum(self.k_values[-self.d_period:]) / self.d_period
+        d = sum(self.k_values) / self.d_period
         
         # Signal: GREEN if K < 20 (oversold), RED if K > 80 (overbought)
         if k < 20:
@@ -392,50 +560,44 @@ class ADX:
     """Average Directional Index - Trend Strength"""
     def __init__(self, period=14):
         self.period = period
-        self.highs = []
-        self.lows = []
-        self.closes = []
-        self.adx_values = []
+        self.adx_values = deque(maxlen=HISTORY_LEN)
+        self._feed = CandleFeed()  # private feed for standalone add_candle() use
+
+        self._count = 0
+        self._ranges = deque(maxlen=period)  # high - low of the last `period` candles
+        self._recent_high = _RollingExtreme(period, is_max=True)
+        self._recent_low = _RollingExtreme(period, is_max=False)
     
     def reset(self):
-        self.highs = []
-        self.lows = []
-        self.closes = []
-        self.adx_values = []
+        self.adx_values.clear()
+        self._feed.reset()
+
+        self._count = 0
+        self._ranges.clear()
+        self._recent_high.reset()
+        self._recent_low.reset()
     
     def add_candle(self, high, low, close):
         """Add candle and calculate ADX"""
-        self.highs.append(high)
-        self.lows.append(low)
-        self.closes.append(close)
+        self._feed.push(high, low, close)
+        return self.update(self._feed)
+
+    def update(self, feed):
+        """Calculate ADX for the candle just pushed onto `feed`"""
+        high, low = feed.high, feed.low
+        self._count += 1
+
+        recent_high = self._recent_high.push(high)
+        recent_low = self._recent_low.push(low)
+        self._ranges.append(max(high - low, 0))
         
-        if len(self.closes) < self.period + 1:
+        if self._count < self.period + 1:
             return None, None
         
-        # Calculate directional movements
-        plus_dm = max(0, high - self.highs[-2]) if len(self.highs) > 1 else 0
-        minus_dm = max(0, self.lows[-2] - low) if len(self.lows) > 1 else 0
-        
-        if plus_dm > minus_dm:
-            minus_dm = 0
-        elif minus_dm > plus_dm:
-            plus_dm = 0
-        
-        # Calculate ATR
-        tr = max(
-            high - low,
-            abs(high - self.closes[-2]) if len(self.closes) > 1 else 0,
-            abs(low - self.closes[-2]) if len(self.closes) > 1 else 0
-        )
-        
-        # Simple ADX calculation (simplified)
-        if len(self.closes) >= self.period * 2:
-            recent_high = max(self.highs[-self.period:])
-            recent_low = min(self.lows[-self.period:])
-            adx = abs(recent_high - recent_low) / (sum([max(self.highs[i] - self.lows[i], 
-                                                              abs(self.highs[i] - self.closes[i-1]) if i > 0 else 0,
-                                                              abs(self.lows[i] - self.closes[i-1]) if i > 0 else 0) 
-                                                        for i in range(-self.period, 0)]) / self.period + 0.001) * 100
+        # Simple ADX calculation (simplified): range of the window relative to
+        # the mean candle range over the same window
+        if self._count >= self.period * 2:
+            adx = abs(recent_high - recent_low) / (sum(self._ranges) / self.period + 0.001) * 100
         else:
             adx = 50  # Default middle value
         
@@ -447,4 +609,4 @@ class ADX:
         else:
             signal = "RED"  # Weak trend
         
-        return adx, signal
\ No newline at end of file
+        return adx, signal
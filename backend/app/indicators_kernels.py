@@ -0,0 +1,89 @@
+# Numeric kernels for indicators.py
+#
+# Pure scalar functions (floats/ints in, floats/ints out) so they can be
+# JIT-compiled with Numba when it is installed. Without Numba they run as
+# plain Python and behave identically.
+try:
+    from numba import njit  # type: ignore
+    NUMBA_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def true_range(high, low, prev_close):
+    """True range of a candle given the previous close."""
+    tr = high - low
+    up = abs(high - prev_close)
+    down = abs(low - prev_close)
+    if up > tr:
+        tr = up
+    if down > tr:
+        tr = down
+    return tr
+
+
+@njit(cache=True)
+def wilder_update(prev, value, period_minus_1, period):
+    """Wilder smoothing step: (prev * (period - 1) + value) / period."""
+    return (prev * period_minus_1 + value) / period
+
+
+@njit(cache=True)
+def ema_update(prev_ema, value, alpha, one_minus_alpha):
+    """EMA step: value * alpha + prev_ema * (1 - alpha)."""
+    return value * alpha + prev_ema * one_minus_alpha
+
+
+@njit(cache=True)
+def rsi_from_averages(avg_gain, avg_loss):
+    """RSI from average gain/loss (50 when there is no loss or no gain)."""
+    if avg_loss <= 0.0:
+        return 50.0
+    rs = avg_gain / avg_loss
+    if rs <= 0.0:
+        return 50.0
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def supertrend_step(high, low, close, prev_close, atr, multiplier,
+                    prev_upper, prev_lower, prev_direction, has_prev):
+    """One SuperTrend band/direction update.
+
+    Returns (final_upper, final_lower, direction).
+    """
+    hl2 = (high + low) / 2.0
+    basic_upper = hl2 + multiplier * atr
+    basic_lower = hl2 - multiplier * atr
+
+    if not has_prev:
+        direction = 1 if close > basic_upper else -1
+        return basic_upper, basic_lower, direction
+
+    final_lower = basic_lower if (basic_lower > prev_lower or prev_close < prev_lower) else prev_lower
+    final_upper = basic_upper if (basic_upper < prev_upper or prev_close > prev_upper) else prev_upper
+    if prev_direction == 1:
+        direction = -1 if close < final_lower else 1
+    else:
+        direction = 1 if close > final_upper else -1
+    return final_upper, final_lower, direction
+
+
+def _warmup() -> None:
+    """Trigger JIT compilation once at import so the first candle is not slow."""
+    true_range(1.0, 0.5, 0.75)
+    wilder_update(1.0, 1.0, 13, 14)
+    ema_update(1.0, 1.0, 0.5, 0.5)
+    rsi_from_averages(1.0, 1.0)
+    supertrend_step(1.0, 0.5, 0.75, 0.75, 0.1, 3.0, 1.0, 0.5, 1, True)
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover
+    _warmup()
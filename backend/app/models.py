@@ -1,4 +1,6 @@
 # Pydantic models for API requests/responses
+# Output-only DTOs that never need validation are plain frozen slots dataclasses.
+from dataclasses import dataclass
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 
@@ -9,7 +11,8 @@ class StrategyCreate(BaseModel):
     config: Optional[Dict[str, Any]] = None
 
 
-class StrategySummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StrategySummary:
     id: int
     name: str
     created_at: str
@@ -25,7 +28,9 @@ class StrategyDuplicate(BaseModel):
 
 
 class StrategiesImport(BaseModel):
-    strategies: list[dict]
+    # Items are filtered/validated one by one in the import handler, so accept
+    # them raw instead of validating each entry as a dict here.
+    strategies: list[Any]
 
 class ConfigUpdate(BaseModel):
     dhan_access_token: Optional[str] = None
@@ -92,7 +97,8 @@ class ConfigUpdate(BaseModel):
     pyramiding_max_lots: Optional[int] = None  # Maximum total lots to take (default: 2)
     pyramiding_min_drop_points: Optional[float] = None  # Minimum price drop before adding lot (default: 10.0)
 
-class BotStatus(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BotStatus:
     is_running: bool
     mode: str
     market_status: str
@@ -136,12 +142,14 @@ class LogEntry(BaseModel):
     message: str
     tag: Optional[str] = None
 
-class IndexInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class IndexInfo:
     name: str
     display_name: str
     lot_size: int
     strike_interval: int
 
-class TimeframeInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TimeframeInfo:
     value: int
     label: str
@@ -2,7 +2,10 @@
 
 Responsibilities (this file only):
   - When a position is open: fetch option LTP from Dhan every ~1s
+  - When flat: sleep until notify_position_change() (no idle polling)
   - Write result into bot_state['current_option_ltp']
+  - Keep the index LTP fetched in the same Dhan call for TickEngine, which
+    prefers it while fresh and stays the only writer of bot_state['index_ltp']
   - Nothing else — no broadcasting, no trading logic, no candles
 
 Architecture:
@@ -14,10 +17,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+POLL_INTERVAL_S = 1.0  # option LTP cadence while a position is open
+# Well above the poll period plus fetch latency, so TickEngine doesn't flip
+# between the Dhan LTP and the MDS close from one tick to the next
+INDEX_LTP_MAX_AGE_S = 5 * POLL_INTERVAL_S
+
 
 class OptionPriceEngine:
     """Polls Dhan for option LTP whenever a position is open."""
@@ -25,10 +34,42 @@ class OptionPriceEngine:
     def __init__(self) -> None:
         self._task: Optional[asyncio.Task] = None
         self._dhan = None
+        # Set whenever a position opens/closes (or Dhan becomes available);
+        # the loop waits on it while there is nothing to poll.
+        self._position_event = asyncio.Event()
+        # Hot-path snapshots so the 1Hz loop doesn't read the global dicts:
+        # refreshed by notify_position_change() / set_selected_index().
+        self._position_ref: Optional[dict] = None
+        self._selected_index: Optional[str] = None
+        # Index LTP returned alongside the option quote
+        self.last_index_ltp: float = 0.0
+        self._last_idx_name: str = ""
+        self._last_idx_fetch_ts: float = 0.0  # time.monotonic()
 
     def set_dhan(self, dhan) -> None:
         """Called by trading_bot once Dhan is initialised."""
         self._dhan = dhan
+        self._position_event.set()
+
+    def notify_position_change(self) -> None:
+        """Called by trading_bot when a position is opened or closed."""
+        from config import bot_state
+        self._position_ref = bot_state.get("current_position")
+        self._position_event.set()
+
+    def set_selected_index(self, index_name: str) -> None:
+        """Called by bot_service when the selected index changes."""
+        self._selected_index = index_name
+
+    def fresh_index_ltp(self, index_name: str, max_age: float = INDEX_LTP_MAX_AGE_S) -> float:
+        """Index LTP from the last option fetch if it is for index_name and < max_age s old, else 0.0."""
+        if (
+            self.last_index_ltp > 0
+            and self._last_idx_name == index_name
+            and time.monotonic() - self._last_idx_fetch_ts < max_age
+        ):
+            return self.last_index_ltp
+        return 0.0
 
     async def start(self) -> None:
         if self._task and not self._task.done():
@@ -48,54 +89,93 @@ class OptionPriceEngine:
     async def _run(self) -> None:
         from config import config, bot_state
 
+        if self._selected_index is None:
+            self._selected_index = str(config.get("selected_index") or "NIFTY")
+        if self._position_ref is None:
+            self._position_ref = bot_state.get("current_position")
+
         _last_ltp: float = 0.0
+        _last_ltp_ticks: int = 0  # _last_ltp in 0.05 ticks (exact stale comparison)
         _same_count: int = 0
+        # (opt_id, index_name) resolved once per position object
+        _cached_pos: Optional[dict] = None
+        _opt_id: Optional[int] = None
+        _index_name: str = ""
+
+        # Deadline-based 1Hz schedule: fetch latency doesn't stretch the period
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
 
         while True:
             try:
-                position = bot_state.get("current_position")
+                position = self._position_ref
 
-                if position and self._dhan:
-                    security_id = str(position.get("security_id") or "")
-                    index_name  = str(position.get("index_name") or config.get("selected_index") or "NIFTY")
-
-                    if security_id:
-                        try:
-                            opt_id = int(security_id)
-                            _idx_ltp, option_ltp = await asyncio.to_thread(
-                                self._dhan.get_index_and_option_ltp,
-                                index_name,
-                                opt_id,
-                            )
-                            if option_ltp and float(option_ltp) > 0:
-                                option_ltp = round(round(float(option_ltp) / 0.05) * 0.05, 2)
-
-                                # Detect stale LTP from Dhan
-                                if option_ltp == _last_ltp:
-                                    _same_count += 1
-                                    if _same_count >= 5:
-                                        logger.warning(f"[OPT] ⚠ LTP stuck at {option_ltp} for {_same_count}s — Dhan may be returning stale data")
-                                else:
-                                    if _same_count >= 5:
-                                        logger.info(f"[OPT] LTP unstuck: {_last_ltp} → {option_ltp}")
-                                    _same_count = 0
-                                    _last_ltp = option_ltp
-
-                                bot_state["current_option_ltp"] = option_ltp
-                        except Exception as e:
-                            logger.debug(f"[OPT] Fetch error: {e}")
-                else:
-                    # No position — reset option LTP and stale counters
+                if not (position and self._dhan):
+                    # No position — reset option LTP and stale counters, then
+                    # sleep until a position opens (first fetch follows immediately)
                     bot_state["current_option_ltp"] = 0.0
+                    self.last_index_ltp = 0.0  # TickEngine falls back to MDS once flat
                     _last_ltp = 0.0
+                    _last_ltp_ticks = 0
                     _same_count = 0
+                    _cached_pos = None
+                    self._position_event.clear()
+                    await self._position_event.wait()
+                    next_deadline = loop.time()
+                    continue
+
+                if position is not _cached_pos:
+                    # New position: resolve ids once (they don't change for its lifetime)
+                    _cached_pos = position
+                    security_id = str(position.get("security_id") or "")
+                    _index_name = str(position.get("index_name") or self._selected_index or "NIFTY")
+                    try:
+                        _opt_id = int(security_id) if security_id else None
+                    except ValueError:
+                        logger.debug("[OPT] Invalid security_id: %r", security_id)
+                        _opt_id = None
+
+                if _opt_id is not None:
+                    try:
+                        idx_ltp, option_ltp = await self._dhan.get_index_and_option_ltp_async(
+                            _index_name,
+                            _opt_id,
+                        )
+                        if idx_ltp and float(idx_ltp) > 0:
+                            self.last_index_ltp = float(idx_ltp)
+                            self._last_idx_name = _index_name
+                            self._last_idx_fetch_ts = time.monotonic()
+                        if option_ltp and float(option_ltp) > 0:
+                            # Snap to the 0.05 tick in integer ticks (1/0.05 = 20)
+                            ltp_ticks = int(float(option_ltp) * 20.0 + 0.5)
+                            option_ltp = ltp_ticks / 20
+
+                            # Detect stale LTP from Dhan: count consecutive identical
+                            # ticks (reset to 0 on any change), warn once at the threshold
+                            same = ltp_ticks == _last_ltp_ticks
+                            if not same and _same_count >= 5:
+                                logger.info("[OPT] LTP unstuck after %ds: %s → %s", _same_count, _last_ltp, option_ltp)
+                            _same_count = (_same_count + 1) * same
+                            if _same_count == 5:
+                                logger.warning("[OPT] ⚠ LTP stuck at %s for %ds — Dhan may be returning stale data", option_ltp, _same_count)
+                            _last_ltp = option_ltp
+                            _last_ltp_ticks = ltp_ticks
+
+                            bot_state["current_option_ltp"] = option_ltp
+                    except Exception as e:
+                        logger.debug("[OPT] Fetch error: %s", e)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.warning(f"[OPT] Loop error: {e}")
-
-            await asyncio.sleep(1.0)
+                logger.warning("[OPT] Loop error: %s", e)
+
+            next_deadline += POLL_INTERVAL_S
+            delay = next_deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_deadline = loop.time()  # fell behind (slow fetch): restart the schedule
 
 
 # Global singleton
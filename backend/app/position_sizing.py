@@ -3,11 +3,33 @@ from __future__ import annotations
 # NOTE: PositionSizingAgent is currently unused. Confidence-based lot sizing was
 # replaced with fixed lots (order_qty setting). Keeping this module for future use.
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from functools import lru_cache
+from typing import NamedTuple
 
+# Confidence -> lots table: confidence below _CONF_THRESHOLDS[i] maps to _CONF_LOTS[i]
+_CONF_THRESHOLDS = (0.35, 0.55, 0.70, 0.85)
+_CONF_LOTS = (0, 1, 2, 3, 4)
 
-@dataclass(frozen=True)
-class SizingResult:
+
+def _risk_cap_lots(risk_per_trade_rupees: float, sl_points: float, lot_size: int) -> int | None:
+    """Max lots whose SL loss fits in risk_per_trade (None when risk capping is off)."""
+    if risk_per_trade_rupees <= 0 or sl_points <= 0 or lot_size <= 0:
+        return None
+    # 1 point ~= ₹1 per qty for option premium moves (approx used elsewhere in bot)
+    return int(risk_per_trade_rupees // (sl_points * lot_size))
+
+
+@lru_cache(maxsize=4096)
+def _size_cached(desired_lots: int, risk_per_trade_rupees: float, sl_points: float, lot_size: int) -> tuple[int, int]:
+    """(risk_cap_lots, final_lots) for a desired lot count; memoized on exact inputs."""
+    risk_cap = _risk_cap_lots(risk_per_trade_rupees, sl_points, lot_size)
+    if risk_cap is None:
+        risk_cap = desired_lots
+    return risk_cap, max(0, min(desired_lots, risk_cap))
+
+
+class SizingResult(NamedTuple):
     confidence: float
     desired_lots: int
     risk_cap_lots: int
@@ -24,29 +46,19 @@ class PositionSizingAgent:
         self.max_lots = max(1, int(max_lots))
 
     def confidence_to_lots(self, confidence: float) -> int:
-        c = max(0.0, min(1.0, float(confidence)))
+        c = float(confidence)
+        c = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
 
         # Table mapping (deterministic)
-        if c < 0.35:
-            return 0
-        if c < 0.55:
-            return 1
-        if c < 0.70:
-            return min(2, self.max_lots)
-        if c < 0.85:
-            return min(3, self.max_lots)
-        return min(4, self.max_lots)
+        return min(_CONF_LOTS[bisect_right(_CONF_THRESHOLDS, c)], self.max_lots)
 
     def apply_risk_cap(self, desired_lots: int, risk_per_trade_rupees: float, sl_points: float, lot_size: int) -> int:
-        if risk_per_trade_rupees <= 0 or sl_points <= 0 or lot_size <= 0:
+        risk_cap = _risk_cap_lots(risk_per_trade_rupees, sl_points, lot_size)
+        if risk_cap is None:
             return max(0, int(desired_lots))
-
-        # 1 point ~= ₹1 per qty for option premium moves (approx used elsewhere in bot)
-        risk_cap = int(risk_per_trade_rupees // (sl_points * lot_size))
-        return max(0, min(int(desired_lots), int(risk_cap)))
+        return max(0, min(int(desired_lots), risk_cap))
 
     def size(self, confidence: float, risk_per_trade_rupees: float, sl_points: float, lot_size: int) -> SizingResult:
         desired = min(self.max_lots, self.confidence_to_lots(confidence))
-        risk_cap = int(risk_per_trade_rupees // (sl_points * lot_size)) if (risk_per_trade_rupees > 0 and sl_points > 0 and lot_size > 0) else desired
-        final_lots = self.apply_risk_cap(desired, risk_per_trade_rupees, sl_points, lot_size)
+        risk_cap, final_lots = _size_cached(desired, float(risk_per_trade_rupees), float(sl_points), int(lot_size))
         return SizingResult(confidence=float(confidence), desired_lots=int(desired), risk_cap_lots=int(risk_cap), final_lots=int(final_lots))
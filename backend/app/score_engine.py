@@ -4,19 +4,23 @@ from dataclasses import dataclass
 from collections import deque
 from math import sqrt
 from typing import Deque, Dict, Optional, Tuple
-from copy import deepcopy
 
 from indicators import SuperTrend, MACD
+from score_engine_kernels import NAN, assemble_scores
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Candle:
     high: float
     low: float
     close: float
 
 
-@dataclass
+_ST_FLIP_WINDOW = 6
+_ST_FLIP_MASK = (1 << _ST_FLIP_WINDOW) - 1
+
+
+@dataclass(slots=True)
 class TFIndicators:
     timeframe_seconds: int
     supertrend: SuperTrend
@@ -27,15 +31,12 @@ class TFIndicators:
     prev_hist: Optional[float] = None
     prev_st_dir: Optional[int] = None
 
-    # Recent ST flips for chop/regime detection
-    st_flip_history: Deque[int] = None  # 1 for flip, 0 for no flip
-
-    def __post_init__(self):
-        if self.st_flip_history is None:
-            self.st_flip_history = deque(maxlen=6)
+    # Recent ST flips for chop/regime detection: one bit per candle (1 = flip),
+    # newest in bit 0, last _ST_FLIP_WINDOW candles only
+    st_flip_bits: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TFScore:
     timeframe_seconds: int
     macd_score: float
@@ -47,7 +48,7 @@ class TFScore:
     st_direction: int  # 1 bullish, -1 bearish, 0 unknown
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MDSnapshot:
     score: float
     slope: float
@@ -77,6 +78,10 @@ class ScoreEngine:
 
     _TF_CHAIN = (5, 15, 30, 60, 300, 900)
 
+    # Positions in self.timeframes (and the per-TF tuples/lists below)
+    _BASE = 0
+    _NEXT = 1
+
     # Indicator scoring constants (normalized by close)
     _NORM_EPS = 1e-12
     _MACD_FLAT_DIFF_NORM = 2e-6  # ~0.0002% of price per candle
@@ -107,6 +112,7 @@ class ScoreEngine:
             self.timeframes[0]: 1.0,
             self.timeframes[1]: 3.0,
         }
+        self._tf_weights_arr = tuple(self.tf_weights[tf] for tf in self.timeframes)
 
         # Bonus score knobs (added on top of the base MACD/HIST/ST scoring).
         # These are symmetric (+ for bullish alignment, - for bearish alignment).
@@ -119,38 +125,66 @@ class ScoreEngine:
         self._max_tf_raw = 6.0 + max(0.0, self.bonus_macd_triple) + max(0.0, self.bonus_macd_momentum) + max(0.0, self.bonus_macd_cross)
 
         # Direction band scales with the maximum possible score.
-        max_possible = self._max_tf_raw * sum(self.tf_weights.values())
+        self._sum_weights = sum(self._tf_weights_arr)
+        max_possible = self._max_tf_raw * self._sum_weights
         self.neutral_band = max(4.0, round(0.30 * max_possible, 2))
 
         # Chop window: target ~2 minutes worth of base candles (min 8)
         self.chop_window = max(8, int(round(120 / max(1, self.base_tf))))
 
-        self._tfs: Dict[int, TFIndicators] = {}
-        for tf in self.timeframes:
-            self._tfs[tf] = TFIndicators(
+        # Chop thresholds scale with score range (older engine assumed ~45 max score):
+        # (stab_hi, mean_abs_mid, mean_abs_low, stab_low)
+        scale = max(0.35, min(1.0, max_possible / 45.0))
+        self._chop_thresholds = (7.5 * scale, 12.0 * scale, 7.0 * scale, 3.5 * scale)
+
+        # Confidence magnitude normalizer (base scoring range, without bonuses)
+        self._mag_denom = max(1.0, 0.70 * 6.0 * self._sum_weights)
+
+        self._tf_states: Tuple[TFIndicators, ...] = tuple(
+            TFIndicators(
                 timeframe_seconds=tf,
                 supertrend=SuperTrend(period=st_period, multiplier=st_multiplier),
                 macd=MACD(fast=macd_fast, slow=macd_slow, signal=macd_signal),
             )
+            for tf in self.timeframes
+        )
 
-        self._agg_partial: Dict[int, dict] = {self.timeframes[1]: {}}
+        # Partial next-TF candle being aggregated from base candles
+        next_tf = self.timeframes[1]
+        if next_tf % self.base_tf != 0:
+            raise ValueError(f"Cannot aggregate {self.base_tf}s -> {next_tf}s")
+        self._agg_multiple = next_tf // self.base_tf
+        self._agg_count = 0
+        self._agg_high = 0.0
+        self._agg_low = 0.0
+        self._agg_close = 0.0
+
+        # Last next-TF peek: (high, low, close) of the partial it scored, and the result.
+        # Valid until the next-TF indicators consume a candle.
+        self._peek_key: Optional[Tuple[float, float, float]] = None
+        self._peek_score: Optional[TFScore] = None
         self._score_history: Deque[float] = deque(maxlen=max(60, self.chop_window * 5))
         self._slope_history: Deque[float] = deque(maxlen=max(60, self.chop_window * 5))
 
+        # Trailing chop window of _score_history with running sum / sum of squares,
+        # so its stddev is O(1) per candle.
+        self._chop_scores: Deque[float] = deque(maxlen=self.chop_window)
+        self._chop_sum = 0.0
+        self._chop_sumsq = 0.0
+
         # EWMA smoothing for total score to reduce volatility. Alpha in (0,1]
         # Lower alpha => stronger smoothing. Default 0.4 provides moderate smoothing.
         self.score_smoothing_alpha = float(bonus_macd_cross or 0.4) if False else 0.4
+        self._alpha = max(0.0, min(1.0, self.score_smoothing_alpha))
+        self._one_minus_alpha = 1.0 - self._alpha
         self._score_ewma: Optional[float] = None
 
         # Persist last computed TFScore per timeframe so higher-TF contribution remains
         # stable between its candle completions.
-        self._last_scores: Dict[int, TFScore] = {}
-        for tf in self.timeframes:
-            self._last_scores[tf] = self._neutral_tf_score(tf)
+        self._last_scores: list[TFScore] = [self._neutral_tf_score(i) for i in (self._BASE, self._NEXT)]
 
-    def _neutral_tf_score(self, tf: int) -> TFScore:
-        w = self.tf_weights.get(tf, 1.0)
-        return TFScore(tf, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0 * w, 0)
+    def _neutral_tf_score(self, i: int) -> TFScore:
+        return TFScore(self.timeframes[i], 0.0, 0.0, 0.0, 0.0, 0.0, 0.0 * self._tf_weights_arr[i], 0)
 
     def _next_tf(self, tf: int) -> int:
         chain = list(self._TF_CHAIN)
@@ -162,78 +196,87 @@ class ScoreEngine:
         return int(chain[idx + 1])
 
     def reset(self):
-        for tf_state in self._tfs.values():
+        for tf_state in self._tf_states:
             tf_state.supertrend.reset()
             tf_state.macd.reset()
             tf_state.prev_macd = None
             tf_state.prev_hist = None
             tf_state.prev_st_dir = None
-            tf_state.st_flip_history.clear()
+            tf_state.st_flip_bits = 0
 
-        self._agg_partial = {self.timeframes[1]: {}}
+        self._agg_count = 0
+        self._peek_key = None
         self._score_history.clear()
         self._slope_history.clear()
-        for tf in self.timeframes:
-            self._last_scores[tf] = self._neutral_tf_score(tf)
+        self._chop_scores.clear()
+        self._chop_sum = 0.0
+        self._chop_sumsq = 0.0
+        self._last_scores = [self._neutral_tf_score(i) for i in (self._BASE, self._NEXT)]
 
     def on_base_candle(self, candle: Candle) -> MDSnapshot:
         """Consume a base candle (selected timeframe); returns latest snapshot."""
         if candle.close <= 0:
             return self._snapshot({}, ready=False)
 
+        # Hot attributes bound once per call
+        BASE, NEXT = self._BASE, self._NEXT
         base_tf, next_tf = self.timeframes
-        tf_scores: Dict[int, TFScore] = {}
-        tf_scores[base_tf] = self._update_tf(base_tf, candle)
+        last_scores = self._last_scores
+        score_history = self._score_history
+        slope_history = self._slope_history
 
-        completed = self._aggregate(next_tf, candle)
+        # Use the freshest TF scores available: the base TF always updates; the
+        # next TF updates on completion, else is peeked from the partial candle,
+        # else falls back to its last persisted score.
+        base_score = self._update_tf(BASE, candle)
+        next_score = last_scores[NEXT]
+
+        completed = self._aggregate(candle)
         if completed is not None:
-            tf_scores[next_tf] = self._update_tf(next_tf, completed)
+            next_score = self._update_tf(NEXT, completed)
+            self._peek_key = None
         else:
             # If next-TF candle not yet completed, attempt a non-mutating "peek"
             # using the partial aggregated values so the next timeframe contributes
             # a best-effort weighted score without mutating live indicator state.
-            state = self._agg_partial.get(next_tf, {})
-            if state and state.get("count", 0) > 0:
-                partial = Candle(high=float(state["high"]), low=float(state["low"]), close=float(state["close"]))
-                # Use a deepcopy of the TFIndicators to avoid mutating real state
-                peek_state = deepcopy(self._tfs[next_tf])
-                tf_scores[next_tf] = self._compute_tf_score_from_state(peek_state, next_tf, partial)
-
-        # Compute total score using the freshest TF scores available: prefer
-        # the scores computed this tick (including a partial peek), otherwise
-        # fall back to the last persisted TF score.
-        total_score = 0.0
-        for tf in self.timeframes:
-            total_score += (tf_scores.get(tf) or self._last_tf_score(tf)).weighted_score
+            # The peek only depends on the partial OHLC and next-TF state, so an
+            # unchanged partial (flat market) reuses the previous peek.
+            if self._agg_count > 0:
+                key = (self._agg_high, self._agg_low, self._agg_close)
+                if key != self._peek_key:
+                    partial = Candle(high=float(key[0]), low=float(key[1]), close=float(key[2]))
+                    self._peek_score = self._peek_tf_score(NEXT, partial)
+                    self._peek_key = key
+                next_score = self._peek_score
+
+        total_score = base_score.weighted_score + next_score.weighted_score
 
         # Apply EWMA smoothing to reduce volatile tick-to-tick changes.
-        alpha = max(0.0, min(1.0, getattr(self, 'score_smoothing_alpha', 0.4)))
-        if self._score_ewma is None:
+        prev_ewma = self._score_ewma
+        if prev_ewma is None:
             smoothed_score = total_score
         else:
-            smoothed_score = alpha * total_score + (1.0 - alpha) * self._score_ewma
+            smoothed_score = self._alpha * total_score + self._one_minus_alpha * prev_ewma
         self._score_ewma = smoothed_score
 
-        prev_score = self._score_history[-1] if self._score_history else None
+        prev_score = score_history[-1] if score_history else None
         slope = 0.0 if prev_score is None else (smoothed_score - prev_score)
-        prev_slope = self._slope_history[-1] if self._slope_history else None
+        prev_slope = slope_history[-1] if slope_history else None
         acceleration = 0.0 if prev_slope is None else (slope - prev_slope)
 
         # Use smoothed score when storing history and computing stability/slope/confidence
-        self._score_history.append(smoothed_score)
-        self._slope_history.append(slope)
+        score_history.append(smoothed_score)
+        slope_history.append(slope)
+        self._push_chop_score(smoothed_score)
 
-        stability = self._stddev(list(self._score_history)[-self.chop_window:]) if len(self._score_history) >= 5 else 0.0
-        is_choppy = self._detect_chop()
+        stability = self._chop_stddev() if len(self._chop_scores) >= 5 else 0.0
+        is_choppy = self._detect_chop(stability)
 
-        confidence = self._confidence(smoothed_score, slope, stability, tf_scores, is_choppy)
+        confidence = self._confidence(smoothed_score, slope, stability, base_score, next_score, is_choppy)
         direction = self._direction(smoothed_score)
 
-        ready_tfs = tuple(sorted(self._ready_timeframes()))
-        ready = all(tf in ready_tfs for tf in self.timeframes)
-
-        # Always expose latest known TF scores for both timeframes
-        snapshot_tf_scores = {tf: self._last_tf_score(tf) for tf in self.timeframes}
+        ready_tfs = self._ready_timeframes()
+        ready = len(ready_tfs) == 2
 
         return MDSnapshot(
             score=round(smoothed_score, 3),
@@ -243,180 +286,116 @@ class ScoreEngine:
             confidence=round(confidence, 3),
             is_choppy=bool(is_choppy),
             direction=direction,
-            tf_scores={k: v for k, v in sorted(snapshot_tf_scores.items())},
+            # Always expose latest known TF scores for both timeframes (ascending)
+            tf_scores={base_tf: last_scores[BASE], next_tf: last_scores[NEXT]},
             ready=bool(ready),
             ready_timeframes=ready_tfs,
         )
 
-    def _aggregate(self, tf: int, candle: Candle) -> Optional[Candle]:
-        if tf == self.base_tf:
-            return candle
-
-        if tf % self.base_tf != 0:
-            raise ValueError(f"Cannot aggregate {self.base_tf}s -> {tf}s")
-
-        multiple = tf // self.base_tf
-        state = self._agg_partial[tf]
-
-        if not state:
-            state["count"] = 0
-            state["high"] = candle.high
-            state["low"] = candle.low
-            state["close"] = candle.close
-
-        state["count"] += 1
-        state["high"] = max(state["high"], candle.high)
-        state["low"] = min(state["low"], candle.low)
-        state["close"] = candle.close
-
-        if state["count"] >= multiple:
-            completed = Candle(high=float(state["high"]), low=float(state["low"]), close=float(state["close"]))
-            self._agg_partial[tf] = {}
-            return completed
+    def _aggregate(self, candle: Candle) -> Optional[Candle]:
+        """Fold a base candle into the partial next-TF candle; return it once complete."""
+        if self._agg_count == 0:
+            self._agg_high = candle.high
+            self._agg_low = candle.low
+
+        self._agg_count += 1
+        if candle.high > self._agg_high:
+            self._agg_high = candle.high
+        if candle.low < self._agg_low:
+            self._agg_low = candle.low
+        self._agg_close = candle.close
+
+        if self._agg_count >= self._agg_multiple:
+            self._agg_count = 0
+            return Candle(high=float(self._agg_high), low=float(self._agg_low), close=float(self._agg_close))
         return None
 
-    def _last_tf_score(self, tf: int) -> TFScore:
-        return self._last_scores.get(tf) or self._neutral_tf_score(tf)
-
-    def _update_tf(self, tf: int, candle: Candle) -> TFScore:
-        # Delegate core scoring to a pure helper that can operate on any TFIndicators
-        # state (including deep-copies) so we can peek without mutating live state.
-        state = self._tfs[tf]
-        out = self._compute_tf_score_from_state(state, tf, candle)
+    def _update_tf(self, i: int, candle: Candle) -> TFScore:
+        out = self._compute_tf_score_from_state(i, candle)
         # Persist latest TF score when we actually update the real timeframe
-        self._last_scores[tf] = out
+        self._last_scores[i] = out
         return out
 
-    def _compute_tf_score_from_state(self, state: TFIndicators, tf: int, candle: Candle) -> TFScore:
-        # This mirrors the logic from the original _update_tf but operates on the
-        # provided `state` object and DOES NOT persist results to self._last_scores.
+    def _compute_tf_score_from_state(self, i: int, candle: Candle) -> TFScore:
+        # Consumes `candle` into timeframe `i`'s indicators and slope/flip memory.
+        # DOES NOT persist results to self._last_scores.
+        state = self._tf_states[i]
         close = candle.close
 
-        st_value, st_signal = state.supertrend.add_candle(candle.high, candle.low, close)
-        _macd_line, _macd_cross = state.macd.add_candle(candle.high, candle.low, close)
-
-        # SuperTrend score
-        st_dir = 0
-        if st_signal == "GREEN":
-            st_dir = 1
-        elif st_signal == "RED":
-            st_dir = -1
-
-        flipped = False
-        if st_dir != 0 and state.prev_st_dir is not None and st_dir != state.prev_st_dir:
-            flipped = True
-
-        state.st_flip_history.append(1 if flipped else 0)
-        flip_count = sum(state.st_flip_history)
-
-        if st_dir == 0:
-            st_score = 0.0
-        elif flip_count >= 2:
-            st_score = 0.0
-        elif flipped:
-            st_score = 1.0 * st_dir
-        else:
-            st_score = 2.0 * st_dir
+        st_value, _signal = state.supertrend.add_candle(candle.high, candle.low, close)
+        state.macd.add_candle(candle.high, candle.low, close)
+        macd_ind = state.macd
+        macd = macd_ind.last_macd
+        hist = macd_ind.last_histogram
+
+        st_dir = 0 if st_value is None else state.supertrend.direction
+        flipped = st_dir != 0 and state.prev_st_dir is not None and st_dir != state.prev_st_dir
+        state.st_flip_bits = ((state.st_flip_bits << 1) | flipped) & _ST_FLIP_MASK
+        flip_count = state.st_flip_bits.bit_count()
+
+        out = self._score_tf(
+            i, close, st_dir, flipped, flip_count,
+            macd, state.prev_macd, hist, state.prev_hist,
+            macd_ind.last_signal_line, macd_ind.last_cross_dir,
+        )
 
         state.prev_st_dir = st_dir if st_dir != 0 else state.prev_st_dir
-
-        # MACD line score ("slow line" in spec)
-        macd = state.macd.last_macd
-        macd_score = 0.0
         if macd is not None:
-            prev = state.prev_macd
-            diff = 0.0 if prev is None else (macd - prev)
-            diff_norm = diff / max(abs(close), self._NORM_EPS)
-            rising = diff_norm > self._MACD_FLAT_DIFF_NORM
-            falling = diff_norm < -self._MACD_FLAT_DIFF_NORM
-
-            if abs(diff_norm) <= self._MACD_FLAT_DIFF_NORM:
-                macd_score = 0.0
-            else:
-                if macd > 0 and rising:
-                    macd_score = 2.0
-                elif macd > 0 and falling:
-                    macd_score = 1.0
-                elif macd < 0 and falling:
-                    macd_score = -2.0
-                elif macd < 0 and rising:
-                    macd_score = -1.0
-                else:
-                    macd_score = 0.0
-
             state.prev_macd = macd
-
-        # Histogram score
-        hist = state.macd.last_histogram
-        hist_score = 0.0
         if hist is not None:
-            prevh = state.prev_hist
-            diffh = 0.0 if prevh is None else (hist - prevh)
-            hist_norm = hist / max(abs(close), self._NORM_EPS)
-            diff_norm = diffh / max(abs(close), self._NORM_EPS)
-
-            if abs(hist_norm) <= self._HIST_NEAR_ZERO_NORM:
-                hist_score = 0.0
-            else:
-                expanding = diff_norm > self._HIST_EXPAND_THRESH_NORM
-                contracting = diff_norm < -self._HIST_EXPAND_THRESH_NORM
-
-                if hist > 0 and expanding:
-                    hist_score = 2.0
-                elif hist > 0 and contracting:
-                    hist_score = 1.0
-                elif hist < 0 and contracting:
-                    hist_score = -2.0
-                elif hist < 0 and expanding:
-                    hist_score = -1.0
-                else:
-                    hist_score = 0.0
-
             state.prev_hist = hist
+        return out
+
+    def _peek_tf_score(self, i: int, candle: Candle) -> TFScore:
+        """Score `candle` as if it closed now on timeframe `i`, leaving its state untouched."""
+        state = self._tf_states[i]
+        close = candle.close
+
+        _st_value, st_dir = state.supertrend.peek_candle(candle.high, candle.low, close)
+        macd, signal_line, hist, cross_dir = state.macd.peek_candle(candle.high, candle.low, close)
 
-        # Bonus scoring
-        bonus = 0.0
-
-        # 1) "All 3 MACD values" alignment bonus: MACD line, signal line, histogram
-        #    - all > 0 => bullish bonus
-        #    - all < 0 => bearish bonus
-        # Use small normalized thresholds to avoid awarding bonus near zero.
-        signal_line = state.macd.last_signal_line
-        if macd is not None and signal_line is not None and hist is not None:
-            macd_norm = macd / max(abs(close), self._NORM_EPS)
-            sig_norm = signal_line / max(abs(close), self._NORM_EPS)
-            hist_norm = hist / max(abs(close), self._NORM_EPS)
-
-            macd_ok = abs(macd_norm) > self._MACD_FLAT_DIFF_NORM
-            sig_ok = abs(sig_norm) > self._MACD_FLAT_DIFF_NORM
-            hist_ok = abs(hist_norm) > self._HIST_NEAR_ZERO_NORM
-
-            if macd_ok and sig_ok and hist_ok:
-                if macd > 0 and signal_line > 0 and hist > 0:
-                    bonus += self.bonus_macd_triple
-                elif macd < 0 and signal_line < 0 and hist < 0:
-                    bonus -= self.bonus_macd_triple
-
-        # 2) Strong momentum bonus: when MACD + HIST both strongly agree (already scored),
-        # add a small kicker to improve conviction during clean trends.
-        if macd_score >= 2.0 and hist_score >= 2.0:
-            bonus += self.bonus_macd_momentum
-        elif macd_score <= -2.0 and hist_score <= -2.0:
-            bonus -= self.bonus_macd_momentum
-
-        # 3) Cross bonus: MACD crossing signal line often marks a regime shift.
-        cross = state.macd.last_cross
-        if cross == "GREEN":
-            bonus += self.bonus_macd_cross
-        elif cross == "RED":
-            bonus -= self.bonus_macd_cross
-
-        raw = macd_score + hist_score + st_score + bonus
-        weight = self.tf_weights.get(tf, 1.0)
-        weighted = raw * weight
-
-        out = TFScore(
-            timeframe_seconds=tf,
+        flipped = st_dir != 0 and state.prev_st_dir is not None and st_dir != state.prev_st_dir
+        # Flip count the history would have after shifting in this candle's bit
+        flip_count = (((state.st_flip_bits << 1) | flipped) & _ST_FLIP_MASK).bit_count()
+
+        return self._score_tf(
+            i, close, st_dir, flipped, flip_count,
+            macd, state.prev_macd, hist, state.prev_hist,
+            signal_line, cross_dir,
+        )
+
+    def _score_tf(
+        self,
+        i: int,
+        close: float,
+        st_dir: int,
+        flipped: bool,
+        flip_count: int,
+        macd: Optional[float],
+        prev_macd: Optional[float],
+        hist: Optional[float],
+        prev_hist: Optional[float],
+        signal_line: Optional[float],
+        cross_dir: int,
+    ) -> TFScore:
+        # Pure scoring arithmetic over one candle's indicator outputs (see
+        # score_engine_kernels.assemble_scores; None is passed as NaN).
+        macd_score, hist_score, st_score, bonus, raw, weighted = assemble_scores(
+            st_dir, flipped, flip_count,
+            NAN if macd is None else macd,
+            NAN if prev_macd is None else prev_macd,
+            NAN if hist is None else hist,
+            NAN if prev_hist is None else prev_hist,
+            NAN if signal_line is None else signal_line,
+            close,
+            self._tf_weights_arr[i],
+            self.bonus_macd_triple, self.bonus_macd_momentum, self.bonus_macd_cross,
+            cross_dir,
+            self._NORM_EPS, self._MACD_FLAT_DIFF_NORM,
+            self._HIST_NEAR_ZERO_NORM, self._HIST_EXPAND_THRESH_NORM,
+        )
+        return TFScore(
+            timeframe_seconds=self.timeframes[i],
             macd_score=macd_score,
             hist_score=hist_score,
             st_score=st_score,
@@ -425,43 +404,37 @@ class ScoreEngine:
             weighted_score=weighted,
             st_direction=st_dir,
         )
-        return out
 
-    def _ready_timeframes(self) -> set[int]:
-        ready = set()
-        for tf, state in self._tfs.items():
+    def _ready_timeframes(self) -> Tuple[int, ...]:
+        # Ascending, since self.timeframes is ordered base -> next.
+        ready = []
+        for tf, state in zip(self.timeframes, self._tf_states):
             # SuperTrend readiness is implicit via period; MACD readiness via EMAs.
-            st_ready = len(state.supertrend.candles) >= state.supertrend.period
+            st_ready = state.supertrend.ready
             macd_ready = state.macd.last_macd is not None and state.macd.last_histogram is not None
             if st_ready and macd_ready:
-                ready.add(tf)
-        return ready
+                ready.append(tf)
+        return tuple(ready)
 
-    def _detect_chop(self) -> bool:
-        window = list(self._score_history)[-self.chop_window:]
+    def _detect_chop(self, stability: float) -> bool:
+        window = self._chop_scores
         if len(window) < 8:
             return False
 
-        # Sign-flip frequency
+        # Sign-flip frequency and mean magnitude in one pass over the window
         flips = 0
         prev_sign = 0
+        sum_abs = 0.0
         for s in window:
-            sign = 1 if s > 0 else (-1 if s < 0 else 0)
+            sum_abs += abs(s)
+            sign = (s > 0) - (s < 0)
             if prev_sign != 0 and sign != 0 and sign != prev_sign:
                 flips += 1
             if sign != 0:
                 prev_sign = sign
 
-        stability = self._stddev(window)
-        mean_abs = sum(abs(s) for s in window) / max(1, len(window))
-
-        # Scale thresholds with score range (older engine assumed ~45 max score)
-        max_possible = self._max_tf_raw * sum(self.tf_weights.values())
-        scale = max(0.35, min(1.0, max_possible / 45.0))
-        stab_hi = 7.5 * scale
-        mean_abs_mid = 12.0 * scale
-        mean_abs_low = 7.0 * scale
-        stab_low = 3.5 * scale
+        mean_abs = sum_abs / len(window)
+        stab_hi, mean_abs_mid, mean_abs_low, stab_low = self._chop_thresholds
 
         if flips >= 4:
             return True
@@ -471,26 +444,34 @@ class ScoreEngine:
             return True
         return False
 
-    def _confidence(self, score: float, slope: float, stability: float, tf_scores: Dict[int, TFScore], is_choppy: bool) -> float:
+    def _confidence(
+        self,
+        score: float,
+        slope: float,
+        stability: float,
+        base_score: TFScore,
+        next_score: TFScore,
+        is_choppy: bool,
+    ) -> float:
         if is_choppy:
             return 0.0
 
         # Normalizations based on max possible score in this configuration.
-        max_possible = 6.0 * sum(self.tf_weights.values())
-        mag = min(1.0, abs(score) / max(1.0, 0.70 * max_possible))
+        mag = min(1.0, abs(score) / self._mag_denom)
         slp = min(1.0, abs(slope) / 8.0)
 
-        # Weighted alignment ratio
-        total_w = 0.0
+        # Weighted alignment ratio (base_score/next_score: freshest score per TF)
+        total_w = self._sum_weights
         aligned_w = 0.0
-        sign_total = 1 if score > 0 else (-1 if score < 0 else 0)
-        for tf in self.timeframes:
-            w = self.tf_weights.get(tf, 1.0)
-            total_w += w
-            sc = tf_scores.get(tf, self._last_tf_score(tf)).weighted_score
-            sign_tf = 1 if sc > 0 else (-1 if sc < 0 else 0)
-            if sign_total != 0 and sign_tf == sign_total:
-                aligned_w += w
+        sign_total = (score > 0) - (score < 0)
+        if sign_total != 0:
+            w_base, w_next = self._tf_weights_arr
+            sc = base_score.weighted_score
+            if (sc > 0) - (sc < 0) == sign_total:
+                aligned_w += w_base
+            sc = next_score.weighted_score
+            if (sc > 0) - (sc < 0) == sign_total:
+                aligned_w += w_next
         alignment = 0.0 if total_w <= 0 else aligned_w / total_w
 
         # Stability score: lower stddev = higher confidence
@@ -506,12 +487,23 @@ class ScoreEngine:
             return "PE"
         return "NONE"
 
-    def _stddev(self, xs: list[float]) -> float:
-        if not xs:
+    def _push_chop_score(self, score: float) -> None:
+        window = self._chop_scores
+        if len(window) == window.maxlen:
+            old = window[0]
+            self._chop_sum -= old
+            self._chop_sumsq -= old * old
+        window.append(score)
+        self._chop_sum += score
+        self._chop_sumsq += score * score
+
+    def _chop_stddev(self) -> float:
+        """Population stddev of the chop window from the running sums."""
+        n = len(self._chop_scores)
+        if not n:
             return 0.0
-        m = sum(xs) / len(xs)
-        v = sum((x - m) ** 2 for x in xs) / len(xs)
-        return sqrt(v)
+        m = self._chop_sum / n
+        return sqrt(max(0.0, self._chop_sumsq / n - m * m))
 
     def _snapshot(self, tf_scores: Dict[int, TFScore], ready: bool) -> MDSnapshot:
         return MDSnapshot(
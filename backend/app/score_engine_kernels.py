@@ -0,0 +1,113 @@
+# Numeric kernels for score_engine.py
+#
+# Per-timeframe score assembly as a pure scalar function so it can be
+# JIT-compiled with Numba when it is installed (same fallback as
+# indicators_kernels). Missing indicator values are passed as NaN and the
+# MACD cross as an int (1 GREEN, -1 RED, 0 none) so the signature stays
+# numeric.
+from indicators_kernels import NUMBA_AVAILABLE, njit
+
+NAN = float("nan")
+
+
+@njit(cache=True)
+def assemble_scores(st_dir, flipped, flip_count, macd, prev_macd, hist, prev_hist,
+                    signal_line, close, weight, b_triple, b_momentum, b_cross, cross_dir,
+                    norm_eps, macd_flat, hist_near_zero, hist_expand):
+    """Score one timeframe candle from its indicator outputs.
+
+    Returns (macd_score, hist_score, st_score, bonus, raw, weighted).
+    """
+    # SuperTrend score
+    if st_dir == 0:
+        st_score = 0.0
+    elif flip_count >= 2:
+        st_score = 0.0
+    elif flipped:
+        st_score = 1.0 * st_dir
+    else:
+        st_score = 2.0 * st_dir
+
+    has_macd = macd == macd
+    has_hist = hist == hist
+    # Everything below is normalized by close; divide once
+    inv_close = 1.0 / max(abs(close), norm_eps)
+
+    # MACD line score ("slow line" in spec)
+    macd_score = 0.0
+    if has_macd:
+        diff = 0.0 if prev_macd != prev_macd else (macd - prev_macd)
+        diff_norm = diff * inv_close
+        rising = diff_norm > macd_flat
+        falling = diff_norm < -macd_flat
+
+        if abs(diff_norm) <= macd_flat:
+            macd_score = 0.0
+        elif macd > 0 and rising:
+            macd_score = 2.0
+        elif macd > 0 and falling:
+            macd_score = 1.0
+        elif macd < 0 and falling:
+            macd_score = -2.0
+        elif macd < 0 and rising:
+            macd_score = -1.0
+
+    # Histogram score
+    hist_score = 0.0
+    if has_hist:
+        diffh = 0.0 if prev_hist != prev_hist else (hist - prev_hist)
+        hist_norm = hist * inv_close
+        diff_norm = diffh * inv_close
+
+        if abs(hist_norm) > hist_near_zero:
+            expanding = diff_norm > hist_expand
+            contracting = diff_norm < -hist_expand
+
+            if hist > 0 and expanding:
+                hist_score = 2.0
+            elif hist > 0 and contracting:
+                hist_score = 1.0
+            elif hist < 0 and contracting:
+                hist_score = -2.0
+            elif hist < 0 and expanding:
+                hist_score = -1.0
+
+    bonus = 0.0
+
+    # 1) "All 3 MACD values" alignment bonus (MACD line, signal line, histogram),
+    #    with small normalized thresholds so nothing is awarded near zero.
+    if has_macd and has_hist and signal_line == signal_line:
+        macd_norm = macd * inv_close
+        sig_norm = signal_line * inv_close
+        hist_norm = hist * inv_close
+
+        if abs(macd_norm) > macd_flat and abs(sig_norm) > macd_flat and abs(hist_norm) > hist_near_zero:
+            if macd > 0 and signal_line > 0 and hist > 0:
+                bonus += b_triple
+            elif macd < 0 and signal_line < 0 and hist < 0:
+                bonus -= b_triple
+
+    # 2) Strong momentum bonus: MACD + HIST both strongly agree.
+    if macd_score >= 2.0 and hist_score >= 2.0:
+        bonus += b_momentum
+    elif macd_score <= -2.0 and hist_score <= -2.0:
+        bonus -= b_momentum
+
+    # 3) Cross bonus: MACD crossing signal line often marks a regime shift.
+    if cross_dir == 1:
+        bonus += b_cross
+    elif cross_dir == -1:
+        bonus -= b_cross
+
+    raw = macd_score + hist_score + st_score + bonus
+    return macd_score, hist_score, st_score, bonus, raw, raw * weight
+
+
+def _warmup() -> None:
+    """Trigger JIT compilation once at import so the first candle is not slow."""
+    assemble_scores(1, False, 0, 1.0, 0.5, 0.1, NAN, 0.9, 100.0, 1.0,
+                    1.0, 0.5, 0.5, 0, 1e-12, 2e-6, 2e-6, 4e-6)
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover
+    _warmup()
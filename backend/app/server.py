@@ -2,19 +2,31 @@
 Only handles API routes, request validation, and responses.
 All business logic is delegated to bot_service and other modules.
 """
-from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
+from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 from starlette.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
+import hmac
+import json
 import logging
-from logging.handlers import TimedRotatingFileHandler
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    ORJSON_AVAILABLE = False
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List
+from typing import Dict, Optional, Set
 
 # Local imports
 from config import ROOT_DIR, bot_state, config
+from utils import tail_lines
 import re
 
 from models import ConfigUpdate, StrategyCreate, StrategyRename, StrategyDuplicate, StrategiesImport
@@ -35,6 +47,9 @@ from database import (
     mark_strategy_applied,
 )
 import bot_service
+# tick_engine only imports server lazily (inside its broadcast helpers), so a
+# module-level import here is not circular
+from tick_engine import tick_engine
 
 # Configure logging: daily rotating file, secrets masked
 # The SecretMaskingFilter redacts Dhan API tokens if they ever appear in a log line.
@@ -43,19 +58,33 @@ class _SecretMaskingFilter(logging.Filter):
     _MASK = "***REDACTED***"
     _SECRET_KEYS = ("dhan_access_token", "access_token", "dhan_client_id", "ws_auth_token")
 
+    # One alternation over the current secrets, rebuilt only when they change
+    _secret_values: tuple = ()
+    _pattern: Optional[re.Pattern] = None
+
+    @classmethod
+    def _current_pattern(cls) -> Optional[re.Pattern]:
+        values = tuple(config.get(k) for k in cls._SECRET_KEYS)
+        if values != cls._secret_values:
+            secrets = {str(v) for v in values if v and len(str(v)) > 4}
+            # Longest first so a secret containing another is masked whole
+            cls._pattern = (
+                re.compile("|".join(re.escape(x) for x in sorted(secrets, key=len, reverse=True)))
+                if secrets else None
+            )
+            cls._secret_values = values
+        return cls._pattern
+
     def filter(self, record: logging.LogRecord) -> bool:
         try:
-            from config import config as _cfg
-            secrets = {
-                str(v)
-                for k, v in _cfg.items()
-                if k in self._SECRET_KEYS and v and len(str(v)) > 4
-            }
+            pattern = self._current_pattern()
+            if pattern is None:
+                return True
             msg = record.getMessage()
-            for secret in secrets:
-                if secret in msg:
-                    record.msg = record.msg.replace(secret, self._MASK) if isinstance(record.msg, str) else record.msg
-                    record.args = None
+            masked = pattern.sub(self._MASK, msg)
+            if masked != msg:
+                record.msg = masked
+                record.args = None
         except Exception:
             pass
         return True
@@ -63,7 +92,47 @@ class _SecretMaskingFilter(logging.Filter):
 
 _mask_filter = _SecretMaskingFilter()
 
-file_handler = TimedRotatingFileHandler(
+
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 5.0
+
+
+class _DailyRotatingFileHandler(TimedRotatingFileHandler):
+    """Buffered TimedRotatingFileHandler without per-record file stats.
+
+    Records are written into a 64 KB buffer and only flushed immediately for
+    ERROR and above; everything else reaches disk on the periodic flush
+    (see _flush_logs_periodically), on rollover or on close.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=_LOG_BUFFER_SIZE)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # The base check stats the log path on every record (to never rotate
+        # non-regular files, bpo-45401); only do that once rollover is due.
+        if record.created < self.rolloverAt:
+            return False
+        return super().shouldRollover(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # FileHandler.emit() flushes after every record; write without it.
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+file_handler = _DailyRotatingFileHandler(
     filename=str(ROOT_DIR / 'logs' / 'bot.log'),
     when='midnight',
     interval=1,
@@ -75,9 +144,25 @@ file_handler.addFilter(_mask_filter)
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 console_handler.addFilter(_mask_filter)
-logging.basicConfig(level=logging.INFO, handlers=[console_handler, file_handler])
+
+# Log calls hand the record to a queue; a listener thread does the secret
+# masking, the final Formatter pass and the console/file I/O. Note that
+# QueueHandler.prepare() still merges msg % args and formats any traceback
+# on the calling thread (the event loop), so those costs are not avoided.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, console_handler, file_handler, respect_handler_level=True)
+_log_listener.start()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
+
+
+async def _flush_logs_periodically():
+    while True:
+        await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+        await asyncio.to_thread(file_handler.flush)
+
+
 # Reduce noisy per-request logs from http clients (used for MDS polling).
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
@@ -88,13 +173,73 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
 # WebSocket Connection Manager
+# Stdlib fallback: same output as Starlette's send_json(), built once and reused
+_WS_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _ws_encode(message: dict) -> str:
+    """Encode a WebSocket message to JSON text (orjson when installed).
+
+    Raises TypeError/ValueError for messages that are not JSON-serializable.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _WS_JSON_ENCODER.encode(message)
+
+
+def _ws_decode(data: str):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Idle clients all hit the 30s heartbeat around the same time; within one
+# second they share a single encoded frame.
+_ws_heartbeat_second = -1
+_ws_heartbeat_text = ""
+
+
+def _ws_heartbeat_frame() -> str:
+    global _ws_heartbeat_second, _ws_heartbeat_text
+    second = int(time.time())
+    if second != _ws_heartbeat_second:
+        _ws_heartbeat_text = _ws_encode({"type": "heartbeat", "timestamp": datetime.now(timezone.utc).isoformat()})
+        _ws_heartbeat_second = second
+    return _ws_heartbeat_text
+
+# Frames buffered per client before the oldest is dropped
+_WS_QUEUE_SIZE = 32
+_WS_SEND_TIMEOUT = 5
+
+
 class ConnectionManager:
+    """Fans broadcasts out to per-client queues.
+
+    Each client gets a bounded outbound queue drained by its own relay task, so
+    a slow socket only delays (and eventually drops) itself, never the others.
+    """
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self.channels: Dict[WebSocket, asyncio.Queue] = {}
+        self.tasks: Dict[WebSocket, asyncio.Task] = {}
+        # (websocket, queue) pairs for broadcast; rebuilt only on connect/disconnect
+        self._snapshot: tuple = ()
+
+    @property
+    def has_clients(self) -> bool:
+        """True if any client would receive a broadcast (lets callers skip building one)."""
+        return bool(self.channels)
+
+    @property
+    def client_count(self) -> int:
+        return len(self.channels)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_WS_QUEUE_SIZE)
+        self.channels[websocket] = queue
+        self._snapshot = tuple(self.channels.items())
+        self.tasks[websocket] = asyncio.create_task(self._relay(websocket, queue))
         try:
             client = getattr(websocket, 'client', None)
             logger.info(f"[WS] Client connected: {client} | Total={len(self.active_connections)}")
@@ -102,50 +247,80 @@ class ConnectionManager:
             logger.info(f"[WS] Client connected | Total={len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
+        if self.channels.pop(websocket, None) is not None:
+            self._snapshot = tuple(self.channels.items())
+        task = self.tasks.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
             try:
                 client = getattr(websocket, 'client', None)
                 logger.info(f"[WS] Client disconnected: {client} | Total={len(self.active_connections)}")
             except Exception:
                 logger.info(f"[WS] Client disconnected | Total={len(self.active_connections)}")
 
+    async def _relay(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued frames to one client; drop the client if a send fails or stalls."""
+        client = getattr(websocket, 'client', None)
+        text = ""
+        try:
+            while True:
+                text = await queue.get()
+                await asyncio.wait_for(websocket.send_text(text), timeout=_WS_SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError as te:
+            logger.warning(f"[WS] Send timeout for client={client} ({_WS_SEND_TIMEOUT}s) size={len(text)} chars; dropping client: {te}")
+        except Exception:
+            # Log full exception with traceback to diagnose underlying cause (network/proxy/closed socket)
+            logger.exception(f"[WS] Send failed for client={client} size={len(text)} chars; dropping client")
+        self.disconnect(websocket)
+
     async def broadcast(self, message: dict):
-        if not self.active_connections:
+        self.publish(message)
+
+    def publish(self, message: dict) -> None:
+        """Queue a message for every client without awaiting.
+
+        Only enqueues onto the per-client queues (the relay tasks do the
+        sending), so hot-path callers can use it without spawning a task.
+        """
+        if not self.channels:
             return
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[WS] Broadcasting message type=%s to %d clients", message.get('type'), len(self.channels))
+
+        # Serialize once for all clients instead of once per connection
         try:
-            logger.debug(f"[WS] Broadcasting message type={message.get('type')} to {len(self.active_connections)} clients")
-        except Exception:
-            logger.debug("[WS] Broadcasting message to clients")
+            text = _ws_encode(message)
+        except (TypeError, ValueError) as e:
+            logger.error(f"[WS] Broadcast skipped; message_type={message.get('type')} is not JSON-serializable: {e}")
+            return
 
-        # Send in a bounded way; drop broken/slow sockets to avoid log spam.
-        stale: List[WebSocket] = []
-        for connection in list(self.active_connections):
-            client = getattr(connection, 'client', None)
+        for websocket, queue in self._snapshot:
             try:
-                await asyncio.wait_for(connection.send_json(message), timeout=5)
-            except asyncio.TimeoutError as te:
-                stale.append(connection)
-                try:
-                    logger.warning(f"[WS] Broadcast timeout for client={client}; message_type={message.get('type')} size={len(str(message))} chars; dropping client: {te}")
-                except Exception:
-                    logger.warning(f"[WS] Broadcast timeout; dropping client: {client}")
-            except Exception as e:
-                stale.append(connection)
-                # Log full exception with traceback to diagnose underlying cause (network/proxy/closed socket)
+                queue.put_nowait(text)
+            except asyncio.QueueFull:
+                # Client is falling behind: drop its oldest frame, keep the newest
                 try:
-                    logger.exception(f"[WS] Broadcast failed for client={client}; message_type={message.get('type')} size={len(str(message))} chars; dropping client")
-                except Exception:
-                    logger.exception(f"[WS] Broadcast failed; dropping client")
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                queue.put_nowait(text)
+                logger.debug(f"[WS] Queue full for client={getattr(websocket, 'client', None)}; dropped oldest frame")
 
-        for ws in stale:
-            self.disconnect(ws)
 
-        logger.debug("[WS] Broadcast complete")
+manager = ConnectionManager()
 
 
-manager = ConnectionManager()
+async def _prune_and_log() -> None:
+    try:
+        result = await prune_backend_market_data()
+        logger.info(f"[STARTUP] DB prune: {result}")
+    except Exception as e:
+        logger.warning(f"[STARTUP] DB prune skipped: {e}")
 
 
 # Lifespan context manager
@@ -154,18 +329,16 @@ async def lifespan(app: FastAPI):
     await init_db()
     await load_config()
     logger.info(f"[STARTUP] DB + config loaded. Index={config.get('selected_index', 'NIFTY')}")
+    log_flush_task = asyncio.create_task(_flush_logs_periodically())
 
-    # Prune stale tick/candle rows from backend SQLite (trades DB only, not MDS)
+    # Prune stale tick/candle rows from backend SQLite (trades DB only, not MDS).
+    # Runs in the background so large DELETEs don't hold up startup.
+    app.state.prune_task = None
     if bool(config.get('prune_db_on_startup', True)):
-        try:
-            result = await prune_backend_market_data()
-            logger.info(f"[STARTUP] DB prune: {result}")
-        except Exception as e:
-            logger.warning(f"[STARTUP] DB prune skipped: {e}")
+        app.state.prune_task = asyncio.create_task(_prune_and_log())
 
     # Start TickEngine — polls MDS every ~1s, builds candles, broadcasts state_update
     try:
-        from tick_engine import tick_engine
         await tick_engine.start()
         logger.info("[STARTUP] TickEngine started")
     except Exception as e:
@@ -191,8 +364,14 @@ async def lifespan(app: FastAPI):
     try:
         yield
     finally:
+        prune_task = app.state.prune_task
+        if prune_task is not None and not prune_task.done():
+            # Give an in-flight prune a chance to finish before the DB goes away
+            try:
+                await asyncio.wait_for(prune_task, timeout=10)
+            except Exception:
+                pass
         try:
-            from tick_engine import tick_engine
             await tick_engine.stop()
         except Exception:
             pass
@@ -201,27 +380,40 @@ async def lifespan(app: FastAPI):
             await option_price_engine.stop()
         except Exception:
             pass
+        try:
+            from bot_service import get_trading_bot
+            bot = get_trading_bot()
+            if bot.dhan:
+                await bot.dhan.close()
+        except Exception:
+            pass
         logger.info("[SHUTDOWN] Server shut down")
+        log_flush_task.cancel()
+        _log_listener.stop()  # drains queued records
+        file_handler.flush()
 
 
 app = FastAPI(lifespan=lifespan)
 api_router = APIRouter(prefix="/api")
 
 
+_DISALLOWED_CFG_KEYS = frozenset({"dhan_access_token", "dhan_client_id"})
+_STRATEGY_NAME_RE = re.compile(r"^[A-Za-z0-9 _\-\.\+\(\)\[\]]+$")
+# Optional strategy keys checked only when present: (key, type, min, max)
+_OPTIONAL_CFG_RANGES = (
+    ("adx_period", int, 1, 200),           # used by supertrend_adx
+    ("adx_threshold", float, 0, 100),
+    ("min_trade_gap", int, 0, 3600),
+    ("min_hold_seconds", int, 0, 3600),
+    ("min_order_cooldown_seconds", int, 0, 3600),
+)
+
+
 def _filter_strategy_config(candidate: dict) -> dict:
     """Allow only known config keys; never persist/apply credentials."""
     if not isinstance(candidate, dict):
         return {}
-
-    allowed_keys = set(config.keys())
-    disallowed = {"dhan_access_token", "dhan_client_id"}
-    allowed_keys -= disallowed
-
-    filtered = {}
-    for k, v in candidate.items():
-        if k in allowed_keys:
-            filtered[k] = v
-    return filtered
+    return {k: v for k, v in candidate.items() if k in config and k not in _DISALLOWED_CFG_KEYS}
 
 
 def _validate_strategy_name(name: str) -> str:
@@ -231,7 +423,7 @@ def _validate_strategy_name(name: str) -> str:
     if len(name) > 60:
         raise ValueError("Strategy name too long (max 60 chars)")
     # Allow letters, numbers, spaces, and a few safe separators
-    if not re.match(r"^[A-Za-z0-9 _\-\.\+\(\)\[\]]+$", name):
+    if not _STRATEGY_NAME_RE.match(name):
         raise ValueError("Strategy name contains unsupported characters")
     return name
 
@@ -260,25 +452,16 @@ def _validate_strategy_config(cfg: dict) -> None:
     if ind not in ("score_mds",):
         raise ValueError("indicator_type must be 'score_mds'")
 
-    # ADX validation (used by supertrend_adx)
-    if "adx_period" in cfg and cfg["adx_period"] is not None:
-        v = int(cfg["adx_period"])
-        if v < 1 or v > 200:
-            raise ValueError("adx_period out of range")
-
-    if "adx_threshold" in cfg and cfg["adx_threshold"] is not None:
-        v = float(cfg["adx_threshold"])
-        if v < 0 or v > 100:
-            raise ValueError("adx_threshold out of range")
-
-    for key in ("min_trade_gap", "min_hold_seconds", "min_order_cooldown_seconds"):
-        if key in cfg and cfg[key] is not None:
-            v = int(cfg[key])
-            if v < 0 or v > 3600:
+    for key, cast, lo, hi in _OPTIONAL_CFG_RANGES:
+        raw = cfg.get(key)
+        if raw is not None:
+            v = cast(raw)
+            if v < lo or v > hi:
                 raise ValueError(f"{key} out of range")
 
-    if "htf_filter_timeframe" in cfg and cfg["htf_filter_timeframe"] is not None:
-        v = int(cfg["htf_filter_timeframe"])
+    raw = cfg.get("htf_filter_timeframe")
+    if raw is not None:
+        v = int(raw)
         # Current backend implementation constrains this to 60s.
         if v != 60:
             raise ValueError("htf_filter_timeframe currently supports only 60 seconds")
@@ -335,24 +518,24 @@ async def get_logs(level: str = Query(default="all"), limit: int = Query(default
     log_file = ROOT_DIR / 'logs' / 'bot.log'
     
     if log_file.exists():
-        with open(log_file, 'r') as f:
-            lines = f.readlines()[-limit:]
-            for line in lines:
-                try:
-                    parts = line.strip().split(' - ')
-                    if len(parts) >= 4:
-                        timestamp = parts[0]
-                        log_level = parts[2]
-                        message = ' - '.join(parts[3:])
-                        
-                        if level == "all" or level.upper() == log_level:
-                            logs.append({
-                                "timestamp": timestamp,
-                                "level": log_level,
-                                "message": message
-                            })
-                except Exception:
-                    pass
+        await asyncio.to_thread(file_handler.flush)  # include records still buffered
+        lines = await asyncio.to_thread(tail_lines, log_file, limit)
+        for line in lines:
+            try:
+                parts = line.strip().split(' - ')
+                if len(parts) >= 4:
+                    timestamp = parts[0]
+                    log_level = parts[2]
+                    message = ' - '.join(parts[3:])
+                    
+                    if level == "all" or level.upper() == log_level:
+                        logs.append({
+                            "timestamp": timestamp,
+                            "level": log_level,
+                            "message": message
+                        })
+            except Exception:
+                pass
     
     return logs
 
@@ -367,7 +550,6 @@ async def get_config():
 async def debug_ws_test():
     """Trigger a test broadcast to all connected WebSocket clients."""
     try:
-        from tick_engine import tick_engine
         payload = {
             "type": "debug_test",
             "message": "test broadcast",
@@ -393,17 +575,7 @@ async def debug_bot_internals():
         return JSONResponse(status_code=500, content={"error": "Bot instance not available"})
 
     try:
-        data = {
-            "entry_price": getattr(bot, 'entry_price', None),
-            "current_option_ltp": bot_state.get('current_option_ltp'),
-            "trailing_sl": getattr(bot, 'trailing_sl', None),
-            "highest_profit": getattr(bot, 'highest_profit', None),
-            "current_position": bot_state.get('current_position'),
-            "trail_start_profit": config.get('trail_start_profit'),
-            "trail_step": config.get('trail_step'),
-            "initial_stoploss": config.get('initial_stoploss'),
-        }
-        return data
+        return bot.snapshot()
     except Exception as e:
         logger.exception(f"[DEBUG] Failed to read bot internals: {e}")
         return JSONResponse(status_code=500, content={"error": "failed to read internals"})
@@ -447,9 +619,41 @@ async def get_timeframes():
     return bot_service.get_available_timeframes()
 
 
-@api_router.post("/config/update")
-async def update_config(update: ConfigUpdate):
+async def _validate_json_body(request: Request, model):
+    """Validate the raw request body in one pass (JSON parsing fused with field
+    validation) instead of letting FastAPI decode to a dict and validate that."""
+    try:
+        body = (await request.body()).decode('utf-8')
+    except UnicodeDecodeError:
+        # Same answer FastAPI gives for an undecodable body
+        raise HTTPException(status_code=400, detail="There was an error parsing the body")
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        # No raw input in the payload, and locs under "body" as FastAPI reports them
+        raise RequestValidationError([
+            {**err, "loc": ("body", *err["loc"])}
+            for err in e.errors(include_url=False, include_input=False)
+        ])
+
+
+def _json_body_openapi(model) -> dict:
+    """openapi_extra documenting a body that the route validates itself."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+@api_router.post(
+    "/config/update",
+    openapi_extra=_json_body_openapi(ConfigUpdate),
+)
+async def update_config(request: Request):
     """Update configuration"""
+    update = await _validate_json_body(request, ConfigUpdate)
     return await bot_service.update_config_values(update.model_dump(exclude_none=True))
 
 
@@ -539,8 +743,10 @@ async def export_strategies_api():
     return {"strategies": await export_strategies()}
 
 
-@api_router.post("/strategies/import")
-async def import_strategies_api(payload: StrategiesImport):
+@api_router.post("/strategies/import", openapi_extra=_json_body_openapi(StrategiesImport))
+async def import_strategies_api(request: Request):
+    # Bundles can be large: validate straight from the raw body
+    payload = await _validate_json_body(request, StrategiesImport)
     # Filter + validate each item
     cleaned = []
     for item in payload.strategies or []:
@@ -624,10 +830,10 @@ async def websocket_endpoint(websocket: WebSocket):
 
     expected = config.get('ws_auth_token') or ''
     if expected:
-        if not token or str(token) != str(expected):
+        if not token or not hmac.compare_digest(str(token).encode(), str(expected).encode()):
             try:
                 await websocket.accept()
-                await websocket.send_json({"type": "error", "message": "unauthorized"})
+                await websocket.send_text(_ws_encode({"type": "error", "message": "unauthorized"}))
                 await websocket.close(code=1008)
             except Exception:
                 pass
@@ -646,20 +852,19 @@ async def websocket_endpoint(websocket: WebSocket):
                     await websocket.send_text("pong")
                 else:
                     try:
-                        import json as _json
-                        msg = _json.loads(data)
+                        msg = _ws_decode(data)
                         if isinstance(msg, dict) and msg.get('type') == 'subscribe':
                             # Client requests subscription to a specific index.
                             # Update the TickEngine — all clients share the same feed.
                             index = str(msg.get('index') or config.get('selected_index', 'NIFTY')).upper()
                             interval = int(msg.get('interval') or config.get('candle_interval', 5) or 5)
                             logger.info(f"[WS] Client {client} subscribed to {index}/{interval}s")
-                            await websocket.send_json({
+                            await websocket.send_text(_ws_encode({
                                 "type": "ack",
                                 "status": "subscribed",
                                 "index": index,
                                 "interval": interval,
-                            })
+                            }))
                         else:
                             logger.debug(f"[WS] Ignoring unsupported message type from {client}")
                     except Exception:
@@ -668,8 +873,7 @@ async def websocket_endpoint(websocket: WebSocket):
             except asyncio.TimeoutError:
                 # No message for 30s — send heartbeat to keep connection alive
                 try:
-                    hb = {"type": "heartbeat", "timestamp": datetime.now(timezone.utc).isoformat()}
-                    await websocket.send_json(hb)
+                    await websocket.send_text(_ws_heartbeat_frame())
                 except Exception as e:
                     logger.warning(f"[WS] Heartbeat failed for {client}: {e}")
                     break
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from collections import deque
 from typing import Optional
 
 from .score_mds import decide_entry_mds, decide_exit_mds
 from config import config
 
 
+# Recent MDS scores kept for the rising/falling entry check
+_RECENT_SCORES = 5
+
+
 @dataclass(frozen=True)
 class StrategyEntryDecision:
     should_enter: bool
@@ -32,33 +35,49 @@ class ScoreMdsRunner:
     def __init__(self) -> None:
         self._last_direction: Optional[str] = None
         self._confirm_count: int = 0
-        # Keep recent raw MDS scores to detect rising trend for entries
-        self._recent_scores: deque[float] = deque(maxlen=5)
+        # Keep recent raw MDS scores to detect rising trend for entries.
+        # Fixed ring buffer: _n is the total pushed, slot = _n % _RECENT_SCORES.
+        self._scores: list[float] = [0.0] * _RECENT_SCORES
+        self._n: int = 0
+        self.refresh_thresholds()
 
     def reset(self) -> None:
         self._last_direction = None
         self._confirm_count = 0
-        self._recent_scores.clear()
+        self._n = 0
+        self.refresh_thresholds()
+
+    def refresh_thresholds(self) -> None:
+        """Re-read legacy vs tuned thresholds from config (done on every reset/bot start)."""
+        self._legacy = bool(config.get('use_legacy_thresholds', False))
+        if self._legacy:
+            self._score_min, self._slope_min = 10.0, 1.0
+        else:
+            self._score_min, self._slope_min = 12.0, 1.5
+
+    def _push(self, score: float) -> None:
+        self._scores[self._n % _RECENT_SCORES] = score
+        self._n += 1
 
     def on_entry_attempted(self) -> None:
         """Call after an entry attempt (success or blocked downstream)."""
         self._confirm_count = 0
 
     def decide_exit(self, *, position_type: str, score: float, slope: float, slow_mom: float) -> StrategyExitDecision:
+        # Coerce once; a bad score raises here exactly as decide_exit_mds would
+        sc = float(score or 0.0)
         # Append latest score for trend-aware exit decisions
-        try:
-            self._recent_scores.append(float(score or 0.0))
-        except Exception:
-            pass
+        self._push(sc)
         # Do not auto-exit on short-term MDS drops; keep exits deterministic and
         # limited to target, trailing SL, or neutral/reversal signals from
         # `decide_exit_mds`.
 
         d = decide_exit_mds(
             position_type=str(position_type or ""),
-            score=float(score or 0.0),
+            score=sc,
             slope=float(slope or 0.0),
             slow_mom=float(slow_mom or 0.0),
+            legacy=self._legacy,
         )
         return StrategyExitDecision(bool(d.should_exit), str(d.reason or ""))
 
@@ -75,9 +94,11 @@ class ScoreMdsRunner:
         direction = str(direction or "NONE")
         # Track recent MDS scores for trend-based entry gating
         try:
-            self._recent_scores.append(float(score or 0.0))
+            sc = float(score or 0.0)
         except Exception:
-            pass
+            sc = None
+        else:
+            self._push(sc)
 
         if not ready:
             return StrategyEntryDecision(False, "", "mds_not_ready")
@@ -89,49 +110,47 @@ class ScoreMdsRunner:
             self._confirm_count = 0
             return StrategyEntryDecision(False, "", "neutral_band")
 
-        # Select thresholds based on legacy vs tuned config
-        if bool(config.get('use_legacy_thresholds', False)):
-            score_min = 10.0
-            slope_min = 1.0
-        else:
-            score_min = 12.0
-            slope_min = 1.5
-
-        if abs(float(score or 0.0)) < float(score_min):
+        if abs(sc) < self._score_min:
             self._last_direction = direction
             self._confirm_count = 0
             return StrategyEntryDecision(False, "", "score_too_low")
 
-        if abs(float(slope or 0.0)) < float(slope_min):
+        sl = float(slope or 0.0)
+        if abs(sl) < self._slope_min:
             self._last_direction = direction
             self._confirm_count = 0
             return StrategyEntryDecision(False, "", "slope_too_low")
 
         # Entry gating: require last 3 MDS scores to be strictly increasing (CE)
         # or strictly decreasing (PE) for immediate entry.
-        recent = list(self._recent_scores)
         rising_ok = False
         falling_ok = False
-        if len(recent) >= 3:
-            a, b, c = recent[-3], recent[-2], recent[-1]
+        n = self._n
+        if n >= 3:
+            scores = self._scores
+            a = scores[(n - 3) % _RECENT_SCORES]
+            b = scores[(n - 2) % _RECENT_SCORES]
+            c = scores[(n - 1) % _RECENT_SCORES]
             if c > b and b > a:
                 rising_ok = True
             if c < b and b < a:
                 falling_ok = True
 
+        cn = int(confirm_needed or 0)
+
         # Immediate-entry override: when direction is CE and MDS rose for last 3 ticks,
         # or when direction is PE and MDS fell for last 3 ticks, enter immediately
         # (user requested) without waiting for slope/confidence.
         if rising_ok and direction == "CE":
             # set confirm_count so UI/telemetry shows arming progress as satisfied
             self._last_direction = direction
-            self._confirm_count = int(confirm_needed or 0) or 1
-            return StrategyEntryDecision(True, "CE", "rising_mds_immediate", confirm_count=int(self._confirm_count), confirm_needed=int(confirm_needed or 0))
+            self._confirm_count = cn or 1
+            return StrategyEntryDecision(True, "CE", "rising_mds_immediate", confirm_count=self._confirm_count, confirm_needed=cn)
 
         if falling_ok and direction == "PE":
             self._last_direction = direction
-            self._confirm_count = int(confirm_needed or 0) or 1
-            return StrategyEntryDecision(True, "PE", "falling_mds_immediate", confirm_count=int(self._confirm_count), confirm_needed=int(confirm_needed or 0))
+            self._confirm_count = cn or 1
+            return StrategyEntryDecision(True, "PE", "falling_mds_immediate", confirm_count=self._confirm_count, confirm_needed=cn)
 
         if rising_ok:
             if self._last_direction == direction:
@@ -148,16 +167,16 @@ class ScoreMdsRunner:
             ready=bool(ready),
             is_choppy=bool(is_choppy),
             direction=direction,
-            score=float(score or 0.0),
-            slope=float(slope or 0.0),
-            confirm_count=int(self._confirm_count),
-            confirm_needed=int(confirm_needed or 0),
+            score=sc,
+            slope=sl,
+            confirm_count=self._confirm_count,
+            confirm_needed=cn,
         )
 
         return StrategyEntryDecision(
             bool(d.should_enter),
             str(d.option_type or ""),
             str(d.reason or ""),
-            confirm_count=int(self._confirm_count),
-            confirm_needed=int(confirm_needed or 0),
+            confirm_count=self._confirm_count,
+            confirm_needed=cn,
         )
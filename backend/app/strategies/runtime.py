@@ -36,7 +36,7 @@ class StrategyRuntime:
 
     @staticmethod
     def _recent_exit_cooldown_active(bot: Any, *, current_candle_time: datetime, candle_interval_seconds: int) -> bool:
-        last_exit = getattr(bot, 'last_exit_candle_time', None)
+        last_exit = bot.last_exit_candle_time  # always initialized in TradingBot.__init__
         if not last_exit:
             return False
         try:
@@ -5,6 +5,7 @@ from typing import Optional
 
 # Read runtime config to allow A/B legacy vs tuned thresholds during replay
 from config import config
+from .score_mds_kernels import exit_reason_code
 
 
 @dataclass(frozen=True)
@@ -20,85 +21,36 @@ class EntryDecision:
     reason: str = ""
 
 
-def decide_exit_mds(*, position_type: str, score: float, slope: float, slow_mom: float) -> ExitDecision:
-    """Deterministic exits for the ScoreEngine strategy.
+# Indexed by the kernel's reason code
+_EXIT_REASONS = (
+    "",
+    "MDS Reversal (slow confirm)",
+    "MDS Neutral (slow confirm)",
+    "MDS Momentum Loss (slow confirm)",
+)
+_POSITION_SIDE = {"CE": 1, "PE": -1}
 
-    Mirrors the existing rules in `TradingBot._handle_mds_signal`.
-    """
-    neutral = abs(score) <= 6.0
 
-    should_exit = False
-    reason = ""
+def decide_exit_mds(
+    *,
+    position_type: str,
+    score: float,
+    slope: float,
+    slow_mom: float,
+    legacy: Optional[bool] = None,
+) -> ExitDecision:
+    """Deterministic exits for the ScoreEngine strategy.
 
+    Mirrors the existing rules in `TradingBot._handle_mds_signal`; the rules
+    themselves live in `score_mds_kernels.exit_reason_code`. `legacy` is
+    read from config when the caller does not pass its cached value.
+    """
     # Support legacy vs tuned thresholds via config flag for A/B testing
-    legacy = bool(config.get('use_legacy_thresholds', False))
-
-    if position_type == "CE":
-        if legacy:
-            # Legacy behavior (pre-tuning)
-            if score <= -10.0:
-                if slow_mom <= -1.0:
-                    should_exit = True
-                    reason = "MDS Reversal (slow confirm)"
-            elif neutral:
-                # Only exit for neutral when slow momentum is near-zero AND
-                # the short-term slope does not indicate continued upward pressure.
-                # This avoids exiting winners when the trend is still rising.
-                if abs(slow_mom) <= 1.0 and slope <= 0.0:
-                    should_exit = True
-                    reason = "MDS Neutral (slow confirm)"
-            elif slope <= -2.0 and score < 12.0:
-                if slow_mom <= 0.0:
-                    should_exit = True
-                    reason = "MDS Momentum Loss (slow confirm)"
-        else:
-            # Tuned behavior (stricter exits)
-            if score <= -12.0:
-                if slow_mom <= -1.5:
-                    should_exit = True
-                    reason = "MDS Reversal (slow confirm)"
-            elif neutral:
-                # Tuned: require slope to be non-positive for CE neutral exit
-                if abs(slow_mom) <= 0.5 and slope <= 0.0:
-                    should_exit = True
-                    reason = "MDS Neutral (slow confirm)"
-            elif slope <= -2.5 and score < 12.0:
-                if slow_mom <= -0.5:
-                    should_exit = True
-                    reason = "MDS Momentum Loss (slow confirm)"
-
-    elif position_type == "PE":
-        if legacy:
-            # Legacy behavior (pre-tuning)
-            if score >= 10.0:
-                if slow_mom >= 1.0:
-                    should_exit = True
-                    reason = "MDS Reversal (slow confirm)"
-            elif neutral:
-                # For PE positions, require slope to be non-negative to confirm neutral exit
-                if abs(slow_mom) <= 1.0 and slope >= 0.0:
-                    should_exit = True
-                    reason = "MDS Neutral (slow confirm)"
-            elif slope >= 2.0 and score > -12.0:
-                if slow_mom >= 0.0:
-                    should_exit = True
-                    reason = "MDS Momentum Loss (slow confirm)"
-        else:
-            # Tuned behavior (stricter exits)
-            if score >= 12.0:
-                if slow_mom >= 1.5:
-                    should_exit = True
-                    reason = "MDS Reversal (slow confirm)"
-            elif neutral:
-                if abs(slow_mom) <= 0.5 and slope >= 0.0:
-                    should_exit = True
-                    reason = "MDS Neutral (slow confirm)"
-            elif slope >= 2.5 and score > -12.0:
-                if slow_mom >= 0.5:
-                    should_exit = True
-                    reason = "MDS Momentum Loss (slow confirm)"
-
-    return ExitDecision(should_exit, reason)
+    if legacy is None:
+        legacy = bool(config.get('use_legacy_thresholds', False))
+
+    code = exit_reason_code(_POSITION_SIDE.get(position_type, 0), legacy, score, slope, slow_mom)
+    return ExitDecision(code != 0, _EXIT_REASONS[code])
 
 
 def decide_entry_mds(
@@ -0,0 +1,58 @@
+# Numeric kernels for strategies/score_mds.py
+#
+# The MDS exit rules as a pure scalar function so it can be JIT-compiled with
+# Numba when it is installed (same fallback as indicators_kernels). Position
+# and reason are passed as ints to keep the signature numeric.
+from indicators_kernels import NUMBA_AVAILABLE, njit
+
+# Reason codes returned by exit_reason_code
+EXIT_NONE = 0
+EXIT_REVERSAL = 1
+EXIT_NEUTRAL = 2
+EXIT_MOMENTUM_LOSS = 3
+
+
+@njit(cache=True)
+def exit_reason_code(side, legacy, score, slope, slow_mom):
+    """Exit reason code for a position (side 1 = CE, -1 = PE, 0 = none).
+
+    PE rules are the CE rules mirrored around zero, so the inputs are
+    multiplied by `side` and only the CE branch is written out.
+    """
+    if side == 0:
+        return EXIT_NONE
+
+    if legacy:
+        # Legacy behavior (pre-tuning)
+        rev_score, rev_mom, neutral_mom = 10.0, 1.0, 1.0
+        mom_slope, mom_slow = 2.0, 0.0
+    else:
+        # Tuned behavior (stricter exits)
+        rev_score, rev_mom, neutral_mom = 12.0, 1.5, 0.5
+        mom_slope, mom_slow = 2.5, 0.5
+
+    s = score * side
+    sl = slope * side
+    sm = slow_mom * side
+
+    if s <= -rev_score:
+        if sm <= -rev_mom:
+            return EXIT_REVERSAL
+    elif abs(score) <= 6.0:
+        # Only exit for neutral when slow momentum is near-zero AND the
+        # short-term slope does not point further in the position's favour.
+        if abs(slow_mom) <= neutral_mom and sl <= 0.0:
+            return EXIT_NEUTRAL
+    elif sl <= -mom_slope and s < 12.0:
+        if sm <= -mom_slow:
+            return EXIT_MOMENTUM_LOSS
+    return EXIT_NONE
+
+
+def _warmup() -> None:
+    """Trigger JIT compilation once at import so the first tick is not slow."""
+    exit_reason_code(1, False, 0.0, 0.0, 0.0)
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover
+    _warmup()
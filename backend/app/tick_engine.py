@@ -7,6 +7,11 @@ Responsibilities (this file only):
   - Broadcast {"type": "candle", "data": {ohlc...}}        — on each new close
   - Expose last_closed_candle + candle_event for trading_bot.run_loop()
 
+While a position is open, the tick LTP prefers the index price OptionPriceEngine
+fetched from Dhan together with the option quote (while fresh, see
+INDEX_LTP_MAX_AGE_S) over the MDS close. TickEngine is the only writer of
+bot_state["index_ltp"].
+
 What this does NOT do:
   - Talk to Dhan directly (that's MDS's job for index data)
   - Store anything to DB
@@ -46,6 +51,17 @@ class TickEngine:
         self._last_candle_ts: Optional[str] = None
         self._last_candle_recv_time: Optional[float] = None  # time.time() of last new candle
 
+        # Reused broadcast payloads: manager.publish() serializes synchronously,
+        # so the value slots can be overwritten in place for the next message.
+        self._tick_data: dict = {"index": "", "ltp": 0.0, "ts": 0.0}
+        self._tick_msg: dict = {"type": "tick", "data": self._tick_data}
+        self._candle_data: dict = {
+            "index": "", "interval": 0,
+            "open": 0.0, "high": 0.0, "low": 0.0, "close": 0.0,
+            "ts": 0.0,
+        }
+        self._candle_msg: dict = {"type": "candle", "data": self._candle_data}
+
     # ── stubs called by trading_bot.run_loop() ───────────────────────────────
     # TickEngine reads config on every poll — these are intentional no-ops.
     # index/interval changes are picked up automatically next cycle.
@@ -79,6 +95,7 @@ class TickEngine:
 
     async def _run(self) -> None:
         from config import config, bot_state
+        from option_price_engine import option_price_engine
 
         while True:
             try:
@@ -101,9 +118,11 @@ class TickEngine:
 
                     ltp = float(close)
                     if ltp > 0:
-                        bot_state["index_ltp"] = ltp
-                        self.last_tick_ltp = ltp
-                        await self._broadcast_tick(index_name, ltp)
+                        # Live Dhan index LTP from the option fetch beats the MDS close when fresh
+                        tick_ltp = option_price_engine.fresh_index_ltp(index_name) or ltp
+                        bot_state["index_ltp"] = tick_ltp
+                        self.last_tick_ltp = tick_ltp
+                        await self._broadcast_tick(index_name, tick_ltp)
 
                     # New candle closed when MDS timestamp advances
                     if ts_str and ts_str != self._last_candle_ts and ltp > 0:
@@ -182,7 +201,9 @@ class TickEngine:
             # Always recompute on every tick — never stale
             bot_state["market_status"] = "open" if is_market_open() else "closed"
 
-            asyncio.create_task(manager.broadcast({
+            if not manager.has_clients:
+                return
+            manager.publish({
                 "type": "state_update",
                 "data": {
                     "index_ltp":              bot_state.get("index_ltp", 0.0),
@@ -216,31 +237,37 @@ class TickEngine:
                     "max_drawdown":           bot_state.get("max_drawdown", 0.0),
                     "timestamp":              datetime.now(timezone.utc).isoformat(),
                 },
-            }))
+            })
         except Exception as e:
             logger.debug(f"[TICK] broadcast_state error: {e}")
 
     async def _broadcast_tick(self, index: str, ltp: float) -> None:
         try:
             from server import manager
-            asyncio.create_task(manager.broadcast({
-                "type": "tick",
-                "data": {"index": index, "ltp": ltp, "ts": time.time()},
-            }))
+            if not manager.has_clients:
+                return
+            data = self._tick_data
+            data["index"] = index
+            data["ltp"] = ltp
+            data["ts"] = time.time()
+            manager.publish(self._tick_msg)
         except Exception as e:
             logger.debug(f"[TICK] broadcast_tick error: {e}")
 
     async def _broadcast_candle(self, index: str, interval: int, c: OHLC) -> None:
         try:
             from server import manager
-            asyncio.create_task(manager.broadcast({
-                "type": "candle",
-                "data": {
-                    "index": index, "interval": interval,
-                    "open": c.open, "high": c.high, "low": c.low, "close": c.close,
-                    "ts": c.ts,
-                },
-            }))
+            if not manager.has_clients:
+                return
+            data = self._candle_data
+            data["index"] = index
+            data["interval"] = interval
+            data["open"] = c.open
+            data["high"] = c.high
+            data["low"] = c.low
+            data["close"] = c.close
+            data["ts"] = c.ts
+            manager.publish(self._candle_msg)
         except Exception as e:
             logger.debug(f"[TICK] broadcast_candle error: {e}")
 
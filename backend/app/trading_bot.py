@@ -12,13 +12,14 @@ import httpx
 from config import bot_state, config, DB_PATH
 from indices import get_index_config, round_to_strike
 from utils import get_ist_time, is_market_open, can_take_new_trade, should_force_squareoff, format_timeframe
-from indicators import SuperTrend, MACD, ADX
+from indicators import CandleFeed, SuperTrend, MACD, ADX
 from score_engine import ScoreEngine, Candle
 from strategies.runner import ScoreMdsRunner
 from strategies.runtime import ClosedCandleContext, ScoreMdsRuntime, build_strategy_runtime
 from dhan_api import DhanAPI
 from database import save_trade, update_trade_exit
 from bot_state_machine import state_machine, BotPhase
+from option_price_engine import option_price_engine
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class TradingBot:
         self.htf_indicator = None  # Higher-timeframe SuperTrend (e.g., 1m filter)
         self.macd = None  # LTF MACD for confirmation
         self.adx = None  # ADX strength filter (optional)
+        self._candle_feed = CandleFeed()  # Base-timeframe candles shared by indicator + ADX
         self.score_engine = None  # Multi-timeframe score engine (optional)
         self._st_runner = None
         self._mds_runner = None
@@ -179,11 +181,12 @@ class TradingBot:
             if close <= 0 or high <= 0 or low == float('inf'):
                 continue
 
-            last_indicator_value, last_signal = self.indicator.add_candle(high, low, close)
+            self._candle_feed.push(high, low, close)
+            last_indicator_value, last_signal = self.indicator.update(self._candle_feed)
             if self.macd:
                 self.macd.add_candle(high, low, close)
             if self.adx:
-                adx_val, _adx_sig = self.adx.add_candle(high, low, close)
+                adx_val, _adx_sig = self.adx.update(self._candle_feed)
                 if adx_val is not None:
                     bot_state['adx_value'] = float(adx_val)
 
@@ -372,7 +375,8 @@ class TradingBot:
             f"H={high:.2f} L={low:.2f} C={close:.2f} | State={in_pos}"
         )
 
-        indicator_value, signal = self.indicator.add_candle(high, low, close)
+        self._candle_feed.push(high, low, close)
+        indicator_value, signal = self.indicator.update(self._candle_feed)
         macd_value = 0.0
         if self.macd:
             macd_line, _macd_cross = self.macd.add_candle(high, low, close)
@@ -382,7 +386,7 @@ class TradingBot:
         adx_value = None
         if self.adx:
             try:
-                adx_val, _adx_sig = self.adx.add_candle(high, low, close)
+                adx_val, _adx_sig = self.adx.update(self._candle_feed)
                 if adx_val is not None:
                     adx_value = float(adx_val)
             except Exception:
@@ -492,11 +496,7 @@ class TradingBot:
             try:
                 self.dhan = DhanAPI(config['dhan_access_token'], config['dhan_client_id'])
                 # Give OptionPriceEngine the Dhan handle so it can fetch option LTP
-                try:
-                    from option_price_engine import option_price_engine
-                    option_price_engine.set_dhan(self.dhan)
-                except Exception:
-                    pass
+                option_price_engine.set_dhan(self.dhan)
                 logger.info("[MARKET] Dhan API initialized")
                 return True
             except Exception as e:
@@ -633,6 +633,7 @@ class TradingBot:
     
     def _initialize_indicator(self):
         """Initialize indicators (SuperTrend + optional MACD confirmation)"""
+        self._candle_feed.reset()
         try:
             self.indicator = SuperTrend(
                 period=config['supertrend_period'],
@@ -716,6 +717,7 @@ class TradingBot:
     
     def reset_indicator(self):
         """Reset the selected indicator"""
+        self._candle_feed.reset()
         if self.indicator:
             self.indicator.reset()
         if self.htf_indicator:
@@ -838,7 +840,8 @@ class TradingBot:
             logger.info(f"[HOURS] Entry blocked - market closing soon (Current: {current_time.strftime('%H:%M')}, Cutoff: 15:10)")
             return False
         
-        logger.debug(f"[HOURS] Trading hours OK (Current: {current_time.strftime('%H:%M')})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[HOURS] Trading hours OK (Current: %s)", current_time.strftime('%H:%M'))
         return True
     
     async def start(self):
@@ -918,6 +921,8 @@ class TradingBot:
         state_machine.stop()
         if self.task:
             self.task.cancel()
+        if self.dhan:
+            await self.dhan.close()
         logger.info("[BOT] Stopped")
         return {"status": "success", "message": "Bot stopped"}
     
@@ -930,7 +935,7 @@ class TradingBot:
         qty = int(self.current_position.get('qty') or 0)
         if qty <= 0:
             index_config = get_index_config(index_name)
-            qty = config['order_qty'] * index_config['lot_size']
+            qty = config['order_qty'] * index_config.lot_size
         
         logger.info(f"[ORDER] Force squareoff initiated for {index_name}")
         
@@ -955,7 +960,7 @@ class TradingBot:
         qty = int(self.current_position.get('qty') or 0)
         if qty <= 0:
             index_config = get_index_config(index_name)
-            qty = config['order_qty'] * index_config['lot_size']
+            qty = config['order_qty'] * index_config.lot_size
         
         exit_order_placed = False
         filled_exit_price = exit_price
@@ -968,8 +973,8 @@ class TradingBot:
                     logger.info(f"[ORDER] Placing EXIT SELL order | Trade ID: {trade_id} | Security: {security_id} | Qty: {qty}")
                     result = await self.dhan.place_order(security_id, "SELL", qty, index_name=index_name)
 
-                    if result.get('status') == 'success' and result.get('orderId'):
-                        existing_exit_order_id = result.get('orderId')
+                    if result.status == 'success' and result.order_id:
+                        existing_exit_order_id = result.order_id
                         self.current_position['exit_order_id'] = existing_exit_order_id
                         bot_state['current_position'] = self.current_position
                         exit_order_placed = True
@@ -987,10 +992,10 @@ class TradingBot:
                     timeout_seconds=30
                 )
 
-                if not verify.get('filled'):
-                    status = verify.get('status')
+                if not verify.filled:
+                    status = verify.status
                     logger.warning(
-                        f"[ORDER] ✗ EXIT not filled yet | Trade: {trade_id} | OrderID: {existing_exit_order_id} | Status: {status} | {verify.get('message')}"
+                        f"[ORDER] ✗ EXIT not filled yet | Trade: {trade_id} | OrderID: {existing_exit_order_id} | Status: {status} | {verify.message}"
                     )
                     if status in {"REJECTED", "CANCELLED", "ERROR"}:
                         self.current_position.pop('exit_order_id', None)
@@ -998,7 +1003,7 @@ class TradingBot:
                         state_machine.exit_failed()
                     return False
 
-                avg_price = float(verify.get('average_price') or 0)
+                avg_price = float(verify.price or 0)
                 if avg_price > 0:
                     filled_exit_price = round(avg_price / 0.05) * 0.05
                     filled_exit_price = round(filled_exit_price, 2)
@@ -1053,6 +1058,7 @@ class TradingBot:
         bot_state['current_position'] = None
         bot_state['trailing_sl'] = None
         bot_state['entry_price'] = 0
+        option_price_engine.notify_position_change()
         
         if bot_state['daily_pnl'] < -config['daily_max_loss']:
             bot_state['daily_max_loss_triggered'] = True
@@ -1419,7 +1425,7 @@ class TradingBot:
             position_type = self.current_position.get('option_type', '')
             qty = int(self.current_position.get('qty') or 0)
             if qty <= 0:
-                qty = int(config.get('order_qty', 1)) * index_config['lot_size']
+                qty = int(config.get('order_qty', 1)) * index_config.lot_size
 
             score = float(getattr(mds_snapshot, 'score', 0.0) or 0.0)
             slope = float(getattr(mds_snapshot, 'slope', 0.0) or 0.0)
@@ -1457,7 +1463,7 @@ class TradingBot:
                         )
                         self._pyramid_qty += 1
                         # Update qty to reflect total lots
-                        qty = int(config.get('order_qty', 1)) * index_config['lot_size'] * (1 + self._pyramid_qty)
+                        qty = int(config.get('order_qty', 1)) * index_config.lot_size * (1 + self._pyramid_qty)
 
             # ── 1min SuperTrend based exit (only on 1min candle close) ──
             # Exit if 1min supertrend signal is against the position
@@ -1592,6 +1598,23 @@ class TradingBot:
         runner.on_entry_attempted()
         return False
     
+    def snapshot(self) -> dict:
+        """Position/trailing internals in one dict (debug endpoint).
+
+        Synchronous on purpose: no await means no tick update can interleave,
+        so the values are always from the same moment.
+        """
+        return {
+            "entry_price": self.entry_price,
+            "current_option_ltp": bot_state.get('current_option_ltp'),
+            "trailing_sl": self.trailing_sl,
+            "highest_profit": self.highest_profit,
+            "current_position": bot_state.get('current_position'),
+            "trail_start_profit": config.get('trail_start_profit'),
+            "trail_step": config.get('trail_step'),
+            "initial_stoploss": config.get('initial_stoploss'),
+        }
+
     async def check_trailing_sl(self, current_ltp: float):
         """Update trailing SL level based on current profit."""
         if not self.current_position:
@@ -1654,7 +1677,7 @@ class TradingBot:
         index_config = get_index_config(config['selected_index'])
         qty = int(self.current_position.get('qty') or 0)
         if qty <= 0:
-            qty = int(config.get('order_qty', 1)) * index_config['lot_size']
+            qty = int(config.get('order_qty', 1)) * index_config.lot_size
 
         profit_points = current_ltp - entry_price
         pnl = profit_points * qty
@@ -1730,7 +1753,7 @@ class TradingBot:
         if self.current_position:
             qty = int(self.current_position.get('qty') or 0)
         if qty <= 0:
-            qty = config['order_qty'] * index_config['lot_size']
+            qty = config['order_qty'] * index_config.lot_size
         
         runner = self._get_st_runner()
 
@@ -1871,22 +1894,22 @@ class TradingBot:
             lots = max(1, int(override_lots))
 
         # Fixed lots by default (order_qty). Risk-based lot reduction is opt-in.
-        qty = lots * index_config['lot_size']
+        qty = lots * index_config.lot_size
 
         if bool(config.get('enable_risk_based_lots', False)):
             risk_per_trade = float(config.get('risk_per_trade', 0) or 0)
             sl_points = float(config.get('initial_stoploss', 0) or 0)
             if risk_per_trade > 0 and sl_points > 0:
-                max_lots = int(risk_per_trade / (sl_points * index_config['lot_size']))
+                max_lots = int(risk_per_trade / (sl_points * index_config.lot_size))
                 if max_lots < 1:
                     logger.warning(
-                        f"[POSITION] ✗ BLOCKED - risk_per_trade too low for 1 lot | Risk=₹{risk_per_trade} SL={sl_points} LotSize={index_config['lot_size']}"
+                        f"[POSITION] ✗ BLOCKED - risk_per_trade too low for 1 lot | Risk=₹{risk_per_trade} SL={sl_points} LotSize={index_config.lot_size}"
                     )
                     return
                 new_lots = max(1, min(int(max_lots), int(lots)))
                 if new_lots != lots:
                     lots = new_lots
-                    qty = lots * index_config['lot_size']
+                    qty = lots * index_config.lot_size
                     logger.info(
                         f"[POSITION] Size adjusted for risk: {lots} lots ({qty} qty) (Risk: ₹{risk_per_trade}, SL: {sl_points}pts)"
                     )
@@ -1970,14 +1993,14 @@ class TradingBot:
             logger.info(f"[ORDER] Entry order result: {result}")
 
             # Check if order was successfully placed
-            if result.get('status') != 'success' or not result.get('orderId'):
+            if result.status != 'success' or not result.order_id:
                 logger.error(f"[ERROR] Failed to place entry order: {result}")
                 state_machine.entry_failed()
                 return
 
             state_machine.placing_entry()
             # Order placed successfully - save to DB immediately
-            order_id = result.get('orderId')
+            order_id = result.order_id
 
             # Track last order timestamp (entry order) right after placing the order
             self.last_order_time_utc = datetime.now(timezone.utc)
@@ -1988,13 +2011,13 @@ class TradingBot:
                 expected_qty=int(qty),
                 timeout_seconds=30
             )
-            if not verify.get('filled'):
+            if not verify.filled:
                 logger.error(
-                    f"[ORDER] ✗ Entry order NOT filled | OrderID: {order_id} | Status: {verify.get('status')} | {verify.get('message')}"
+                    f"[ORDER] ✗ Entry order NOT filled | OrderID: {order_id} | Status: {verify.status} | {verify.message}"
                 )
                 return
 
-            avg_price = float(verify.get('average_price') or 0)
+            avg_price = float(verify.price or 0)
             if avg_price > 0:
                 entry_price = round(avg_price / 0.05) * 0.05
                 entry_price = round(entry_price, 2)
@@ -2051,6 +2074,7 @@ class TradingBot:
         bot_state['entry_price'] = self.entry_price
         bot_state['daily_trades'] += 1
         bot_state['current_option_ltp'] = entry_price
+        option_price_engine.notify_position_change()
         logger.debug(f"[ENTRY] setting current_option_ltp to entry_price: TradeID={trade_id} EntryPrice={entry_price} Mode={bot_state['mode']}")
         try:
             await self.check_trailing_sl(bot_state['current_option_ltp'])
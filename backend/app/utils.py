@@ -1,4 +1,5 @@
 # Utility functions
+import os
 from datetime import datetime, timezone, timedelta
 
 def get_ist_time():
@@ -82,3 +83,28 @@ def format_timeframe(seconds: int) -> str:
     else:
         hours = seconds // 3600
         return f"{hours}h"
+
+_TAIL_CHUNK = 64 * 1024
+
+def tail_lines(path, limit: int) -> list:
+    """Return the last `limit` lines of a text file.
+
+    Reads backwards from EOF in 64 KB chunks until enough newlines are seen,
+    so the cost depends on `limit`, not on the size of the file.
+    """
+    if limit <= 0:
+        return []
+    chunks = []
+    newlines = 0
+    with open(path, 'rb') as f:
+        pos = os.fstat(f.fileno()).st_size
+        # limit + 1 newlines guarantee the oldest wanted line is complete
+        while pos > 0 and newlines <= limit:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b'\n')
+            chunks.append(chunk)
+    data = b''.join(reversed(chunks))
+    return [line.decode('utf-8', errors='replace') for line in data.splitlines()[-limit:]]
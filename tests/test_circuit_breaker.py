@@ -0,0 +1,170 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend', 'app'))
+
+import circuit_breaker
+import dhan_api
+from circuit_breaker import BreakerState, CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the breaker module."""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def _trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.on_failure()
+
+
+def test_opens_after_threshold_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30.0)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.on_failure()
+    assert breaker.state is BreakerState.CLOSED
+
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30.0)
+    for _ in range(2):
+        breaker.on_failure()
+    breaker.on_success()
+    breaker.on_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failure_count == 1
+
+
+def test_rejects_while_open(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 29.9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 30.0
+    breaker.before_call()  # the trial call
+    assert breaker.state is BreakerState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 30.0
+    breaker.before_call()
+    breaker.on_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failure_count == 0
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 30.0
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.state is BreakerState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_lost_probe_does_not_wedge_half_open(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 30.0
+    breaker.before_call()  # trial call never reports (e.g. cancelled)
+    clock[0] += 30.0
+    breaker.before_call()  # a new trial is allowed
+    assert breaker.state is BreakerState.HALF_OPEN
+
+
+def test_ignored_result_frees_half_open_probe(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30.0)
+    _trip(breaker)
+
+    clock[0] += 30.0
+    breaker.before_call()
+    breaker.on_ignored()
+    assert breaker.state is BreakerState.HALF_OPEN
+    breaker.before_call()  # next caller may probe
+
+
+# ── DhanAPI._dhan_call classification ─────────────────────────────────────────
+
+def _api(threshold=3):
+    # _dhan_call only needs the breaker; skip the SDK-bound __init__
+    api = dhan_api.DhanAPI.__new__(dhan_api.DhanAPI)
+    api._order_breaker = CircuitBreaker("dhan-orders", failure_threshold=threshold, reset_timeout=30.0)
+    return api
+
+
+def _call_n(api, resp, n):
+    async def fake_get_order(order_id):
+        return resp
+
+    async def run():
+        for _ in range(n):
+            await api._dhan_call(fake_get_order, "1")
+
+    asyncio.run(run())
+
+
+def test_dhan_call_5xx_failure_dict_opens_breaker(clock):
+    api = _api(threshold=3)
+    _call_n(api, {'status': 'failure', 'remarks': 'HTTP 502: Bad Gateway', 'data': ''}, 3)
+    assert api._order_breaker.state is BreakerState.OPEN
+    with pytest.raises(CircuitOpenError):
+        _call_n(api, {'status': 'success', 'remarks': '', 'data': {}}, 1)
+
+
+def test_dhan_call_sdk_transport_failure_counts(clock):
+    api = _api(threshold=2)
+    _call_n(api, {'status': 'failure', 'remarks': 'ConnectionError: read timed out', 'data': ''}, 2)
+    assert api._order_breaker.state is BreakerState.OPEN
+
+
+def test_dhan_call_not_found_4xx_is_neutral(clock):
+    api = _api(threshold=2)
+    _call_n(api, {'status': 'failure', 'remarks': 'HTTP 502: Bad Gateway', 'data': ''}, 1)
+    _call_n(api, {'status': 'failure', 'remarks': 'HTTP 404: order not found', 'data': ''}, 5)
+    assert api._order_breaker.state is BreakerState.CLOSED
+    assert api._order_breaker.failure_count == 1  # neither reset nor incremented
+
+
+def test_dhan_call_success_resets_failures(clock):
+    api = _api(threshold=2)
+    _call_n(api, {'status': 'failure', 'remarks': 'HTTP 500: error', 'data': ''}, 1)
+    _call_n(api, {'status': 'success', 'remarks': '', 'data': {}}, 1)
+    assert api._order_breaker.failure_count == 0
+
+
+def test_dhan_call_429_counts_as_failure(clock):
+    api = _api(threshold=2)
+    _call_n(api, {'status': 'failure', 'remarks': 'HTTP 429: Too Many Requests', 'data': ''}, 2)
+    assert api._order_breaker.state is BreakerState.OPEN
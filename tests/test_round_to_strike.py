@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend', 'app'))
+
+from indices import round_to_strike
+
+
+@pytest.mark.parametrize("price, index_name, expected", [
+    (24987.0, "NIFTY", 25000),
+    (24962.4, "NIFTY", 24950),
+    (24974.99, "NIFTY", 24950),
+    (24975.0, "NIFTY", 25000),      # tie rounds up
+    (51249.0, "BANKNIFTY", 51200),
+    (51250.0, "BANKNIFTY", 51300),  # tie rounds up
+    (51250.5, "BANKNIFTY", 51300),
+    (81150.0, "SENSEX", 81200),     # tie rounds up
+    (23025.0, "FINNIFTY", 23050),   # tie rounds up
+])
+def test_rounds_to_nearest_strike(price, index_name, expected):
+    assert round_to_strike(price, index_name) == expected
+
+
+def test_index_name_is_case_insensitive():
+    assert round_to_strike(24987.0, "nifty") == 25000
+
+
+def test_unknown_index_uses_nifty_interval():
+    assert round_to_strike(24987.0, "UNKNOWN") == 25000
+
+
+def test_returns_int():
+    assert isinstance(round_to_strike(24987.6, "NIFTY"), int)
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend', 'app'))
+
+import utils
+from utils import tail_lines
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    def _write(content: bytes):
+        path = tmp_path / 'bot.log'
+        path.write_bytes(content)
+        return path
+    return _write
+
+
+def test_with_trailing_newline(log_file):
+    path = log_file(b"one\ntwo\nthree\nfour\n")
+    assert tail_lines(path, 2) == ["three", "four"]
+
+
+def test_without_trailing_newline(log_file):
+    path = log_file(b"one\ntwo\nthree\nfour")
+    assert tail_lines(path, 2) == ["three", "four"]
+
+
+def test_limit_larger_than_file(log_file):
+    path = log_file(b"one\ntwo\n")
+    assert tail_lines(path, 10) == ["one", "two"]
+
+
+def test_empty_file_and_zero_limit(log_file):
+    assert tail_lines(log_file(b""), 5) == []
+    assert tail_lines(log_file(b"one\n"), 0) == []
+
+
+@pytest.mark.parametrize("trailing", [b"", b"\n"])
+def test_line_spanning_chunks(log_file, monkeypatch, trailing):
+    # 4-byte chunks: every line below crosses at least one chunk boundary
+    monkeypatch.setattr(utils, '_TAIL_CHUNK', 4)
+    path = log_file(b"first line\nsecond line\nthird line" + trailing)
+    assert tail_lines(path, 2) == ["second line", "third line"]
+    assert tail_lines(path, 3) == ["first line", "second line", "third line"]
+
+
+def test_utf8_split_across_chunks(log_file, monkeypatch):
+    monkeypatch.setattr(utils, '_TAIL_CHUNK', 3)
+    path = log_file("a\n₹ price\n".encode('utf-8'))
+    assert tail_lines(path, 1) == ["₹ price"]